@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Нагрузочный тест JSON API таблицы результатов.
+#
+#   python3 bench_api.py [--url=http://127.0.0.1:9000] [--clients=20] [--seconds=10]
+#   python3 bench_api.py --local [--teams=50]
+#
+# Каждый клиент держит keep-alive соединение и по кругу запрашивает
+# /api/scoreboard, /api/round и /api/teams/<id>/history (с If-None-Match
+# после первого ответа, как это делают оверлеи и боты).
+#
+# --local меряет в одном процессе, без сервера и базы, путь ответа
+# /api/scoreboard: сериализация и gzip на каждый запрос против готового
+# ответа из кэша. Время запросов к Mongo сюда не входит.
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+
+def worker(url, paths, deadline, latencies, counters):
+    conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=10)
+    etags = {}
+    i = 0
+    while time.monotonic() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        headers = {'Accept-Encoding': 'gzip'}
+        if path in etags:
+            headers['If-None-Match'] = etags[path]
+
+        started = time.perf_counter()
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            counters['errors'] += 1
+            conn.close()
+            conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - started)
+
+        if response.getheader('ETag'):
+            etags[path] = response.getheader('ETag')
+        counters[response.status] = counters.get(response.status, 0) + 1
+    conn.close()
+
+
+def local(teams, n=2000):
+    from bson import ObjectId
+    from flask import Flask
+    from classes.apicache import CachedResponse
+    from classes.scoreboard import Scoreboard
+
+    services = ('history', 'crypto-inc', 'support', 'loogles', 'runaway')
+    payload = {'round': 120, 'page': 1, 'per_page': teams, 'total': teams, 'teams': [{
+        'id': str(ObjectId()), 'name': 'team%d' % i, 'host': '10.0.%d.2' % i, 'rank': i + 1,
+        'score': round(random.random() * 10000, 2), 'attack': random.randint(0, 500),
+        'defense': random.randint(0, 500), 'stolen': random.randint(0, 50),
+        'services': dict((name, {'up_round': 100, 'uptime': 83.3, 'attack': 10, 'defense': 20, 'status': 'UP'})
+                         for name in services)
+    } for i in range(teams)]}
+
+    board = Scoreboard.__new__(Scoreboard)
+    app = Flask(__name__)
+    cached = CachedResponse(payload)
+
+    for label, entry, headers in (
+            ('no cache, gzip', lambda: CachedResponse(payload), {'Accept-Encoding': 'gzip'}),
+            ('cached, gzip', lambda: cached, {'Accept-Encoding': 'gzip'}),
+            ('cached, identity', lambda: cached, {}),
+            ('cached, 304', lambda: cached, {'Accept-Encoding': 'gzip', 'If-None-Match': cached.gzip_etag})):
+        with app.test_request_context('/api/scoreboard', headers=headers):
+            started = time.perf_counter()
+            for _ in range(n):
+                response = board.json_response(entry())
+            took = (time.perf_counter() - started) / n
+        print('%-18s %7.3f ms  %6.0f rps  %d bytes' % (label, took * 1000, 1 / took,
+                                                     len(response.get_data())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scoreboard API benchmark')
+    parser.add_argument('--url', default='http://127.0.0.1:9000')
+    parser.add_argument('--clients', type=int, default=20)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--local', action='store_true', help='response path only, no server and no database')
+    parser.add_argument('--teams', type=int, default=50)
+    args = parser.parse_args()
+
+    if args.local:
+        local(args.teams)
+        return
+
+    url = urlparse(args.url)
+    paths = ['/api/scoreboard', '/api/round']
+
+    conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=10)
+    conn.request('GET', '/api/scoreboard?per_page=1')
+    teams = json.loads(conn.getresponse().read().decode('utf-8'))['teams']
+    conn.close()
+    if teams:
+        paths.append('/api/teams/%s/history' % teams[0]['id'])
+
+    deadline = time.monotonic() + args.seconds
+    results = []
+    threads = []
+    for i in range(args.clients):
+        latencies = []
+        counters = {'errors': 0}
+        results.append((latencies, counters))
+        threads.append(threading.Thread(target=worker, args=(url, paths, deadline, latencies, counters)))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    latencies = sorted(l for r in results for l in r[0])
+    statuses = {}
+    for _, counters in results:
+        for k, v in counters.items():
+            statuses[k] = statuses.get(k, 0) + v
+
+    if not latencies:
+        print('No successful requests, statuses: %r' % statuses)
+        return
+
+    print('requests: %d, %.0f rps' % (len(latencies), len(latencies) / args.seconds))
+    print('statuses: %r' % statuses)
+    for p in (50, 90, 99):
+        print('p%d: %.2f ms' % (p, latencies[int(len(latencies) * p / 100) - 1] * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+import gzip
+import hashlib
+import json
+import threading
+import time
+
+from bson import json_util
+
+
+class CachedResponse:
+    __slots__ = ('body', 'gzip_body', 'etag', 'gzip_etag')
+
+    def __init__(self, data):
+        self.body = json.dumps(data, default=json_util.default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.gzip_body = gzip.compress(self.body, 6)
+        digest = hashlib.md5(self.body).hexdigest()
+        # у сжатого варианта другое тело, значит и свой ETag
+        self.etag = '"' + digest + '"'
+        self.gzip_etag = '"' + digest + '-gz"'
+
+
+# Кэш готовых (сериализованных и сжатых) JSON-ответов API.
+# Сбрасывается, когда меняется версия игры: номер раунда или счётчик изменений
+# таблицы в коллекции game. Версия перечитывается не чаще раза в check_interval.
+# Каждая запись помечена версией, под которой построена, и не больше max_entries
+# записей живут одновременно (вытесняются давно не запрошенные).
+class ApiCache:
+    def __init__(self, db, check_interval=0.5, max_entries=1024):
+        self.db = db
+        self.check_interval = check_interval
+        self.max_entries = max_entries
+        self.checked = 0
+        self.current_version = None
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def version(self):
+        now = time.monotonic()
+        if now - self.checked >= self.check_interval:
+            game = self.db.game.find_one({'_id': 'round'}) or {}
+            version = (game.get('current', 0), game.get('closed', 0), game.get('changes', 0))
+            with self.lock:
+                self.checked = now
+                if version != self.current_version:
+                    self.current_version = version
+                    self.entries.clear()
+        return self.current_version
+
+    def get(self, key, builder):
+        version = self.version()
+        with self.lock:
+            cached = self.entries.get(key)
+            if cached is not None and cached[0] == version:
+                self.entries.move_to_end(key)
+                return cached[1]
+
+        entry = CachedResponse(builder())
+        with self.lock:
+            # пока строили, версия могла смениться: такой ответ отдаём, но не храним
+            if version == self.current_version:
+                self.entries[key] = (version, entry)
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return entry
@@ -1,3 +1,4 @@
+import json
 import subprocess
 from config.main import BASE_PATH
 __author__ = 'dmitry'
@@ -14,41 +15,56 @@ class Checker:
     def __init__(self):
         pass
 
-    def status(self, popen):
+    # Возвращает stdout чекера, при ошибке бросает Exception(code, stdout)
+    def status(self, popen, output):
         code = popen.returncode
 
         if code == self.STATUS_CODE['SUCCESS']:
-            return True
+            return output
 
         # if code not in self.STATUS_CODE.values():
         #     code = 0
 
-        raise Exception(popen.returncode, popen.stdout.read())
-
-    def get(self, host, path_to_program, flag, flag_id):
-        args = (BASE_PATH + path_to_program, "get", host, flag_id, flag)
+        raise Exception(popen.returncode, output)
 
+    def run(self, args):
         popen = subprocess.Popen(args, stdout=subprocess.PIPE)
+        # communicate, а не wait: большой вывод не заблокирует чекер на pipe
+        output, _ = popen.communicate()
 
-        popen.wait()
-        # TODO: сделать запись в лог переменной output
-        output = popen.stdout.read()
+        return self.status(popen, output.decode('utf-8', 'replace'))
+
+    def get(self, host, path_to_program, flag, flag_id):
+        args = (BASE_PATH + path_to_program, "get", host, flag_id, flag)
 
-        return self.status(popen)
+        return self.run(args)
 
     def check(self, host, path_to_program):
         args = (BASE_PATH + path_to_program, "check", host)
-        popen = subprocess.Popen(args, stdout=subprocess.PIPE)
-        popen.wait()
 
-        return self.status(popen)
+        return self.run(args)
 
     def put(self, host, path_to_program, flag, flag_id):
         args = (BASE_PATH + path_to_program, "put", host, flag_id, flag)
 
-        popen = subprocess.Popen(args, stdout=subprocess.PIPE)
-        popen.wait()
+        return self.run(args)
 
-        output = popen.stdout.read()
-
-        return self.status(popen)
+    # check + put + get за один запуск чекера (действие round).
+    # Возвращает (код, stdout, шаги [{action, code, time}]) и не бросает
+    def round(self, host, path_to_program, flag, flag_id):
+        args = (BASE_PATH + path_to_program, "round", host, flag_id, flag)
+        popen = subprocess.Popen(args, stdout=subprocess.PIPE)
+        output, _ = popen.communicate()
+        output = output.decode('utf-8', 'replace')
+
+        return popen.returncode, output, self.steps(output)
+
+    @staticmethod
+    def steps(output):
+        for line in reversed(output.splitlines()):
+            if line.startswith('ROUND '):
+                try:
+                    return json.loads(line[len('ROUND '):])
+                except ValueError:
+                    break
+        return []
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+from config.main import CHECKER
+
+
+# Проверка доступности сервисов: неблокирующий TCP connect на порт сервиса
+# сразу ко всем командам. Недоступные хосты запоминаются до конца раунда,
+# чекер для них не запускается вовсе.
+class Probe:
+    def __init__(self, timeout=None):
+        self.timeout = timeout or CHECKER['PROBE_TIMEOUT']
+        self.lock = threading.Lock()
+        self.round = None
+        self.down = {}       # service -> множество недоступных хостов
+        self.pending = {}    # service -> Event, пока идет проверка
+
+    async def _connect(self, host, port):
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+    async def _probe(self, hosts, port):
+        results = await asyncio.gather(*[self._connect(host, port) for host in hosts])
+        return dict(zip(hosts, results))
+
+    # {host: True/False} для всех хостов одним пакетом
+    def probe(self, hosts, port):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self._probe(list(hosts), int(port)))
+        finally:
+            loop.close()
+
+    # Первый вызов в раунде проверяет всех (hosts() - список хостов команд),
+    # остальные ждут его результата
+    def is_down(self, round, service, host, hosts):
+        if not service.get('port'):
+            return False
+
+        name = service['name']
+        with self.lock:
+            if self.round != round:
+                self.round, self.down, self.pending = round, {}, {}
+            if name in self.down:
+                return host in self.down[name]
+            event = self.pending.get(name)
+            owner = event is None
+            if owner:
+                event = self.pending[name] = threading.Event()
+
+        if owner:
+            try:
+                results = self.probe(hosts(), service['port'])
+                down = set(h for h, up in results.items() if not up)
+            except Exception:
+                down = set()
+            with self.lock:
+                if self.round == round:
+                    self.down[name] = down
+            event.set()
+            return host in down
+
+        event.wait(self.timeout + 1)
+        with self.lock:
+            return host in self.down.get(name, ())
@@ -1,6 +1,8 @@
 import pika, json
 from bson import json_util
 from config.main import QUEUE
+from classes.metrics import QUEUE_DEPTH
+from classes.logger import log
 
 class Queue:
     list = []
@@ -21,16 +23,20 @@ class Queue:
         self.list.append(kwargs)
 
     def run(self):
+        QUEUE_DEPTH.set(len(self.list))
         for task in self.list:
             self.channel.basic_publish(
                 exchange='',
                 routing_key=QUEUE['QNAME'],
                 body=json.dumps(task, default=json_util.default)
             )
-            print('Sended')
+            QUEUE_DEPTH.dec()
+
+        log.info('queue.sent', count=len(self.list))
 
     def clear(self):
         # Если вдруг у нас задания не отправились в очередь
         self.list = []
         # Очищаем очередь, если задания остались
         self.channel.queue_purge(queue=QUEUE['QNAME'])
+        QUEUE_DEPTH.set(0)
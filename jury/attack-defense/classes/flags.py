@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 from classes.config.get import ConfigGet
 from config.main import *
-import multiprocessing
+import threading
 import socket
 import sys
 import time
@@ -10,6 +10,8 @@ import re
 import pymongo
 from ipaddress import IPv4Address, IPv4Network
 from functions import Message
+from classes.logger import log
+from classes.metrics import FLAGS_SUBMITTED, FLAGS_ACCEPTED, FLAGS_REJECTED, FLAGS_CONNECTIONS
 
 
 class Flags:
@@ -40,11 +42,12 @@ class Flags:
 
             while True:
                 self.conn, self.address = self.socket.accept()
-                Message.info('connected:' + self.address[0])
+                log.info('flags.connected', ip=self.address[0])
 
-                process = multiprocessing.Process(target=self.recv, args=(self.conn, self.address))
-                process.daemon = True
-                process.start()
+                # Потоки вместо процессов: реестр метрик и клиент Mongo общие
+                thread = threading.Thread(target=self.recv, args=(self.conn, self.address))
+                thread.daemon = True
+                thread.start()
 
         except KeyboardInterrupt:
             print('Module flags is shutdown')
@@ -54,35 +57,43 @@ class Flags:
     def recv(self, connection, address):
         teams = self.db.teams.find()
         # ip = IPv4Address()
-        print(address)
         team = False
         for e in teams:
             #if e['network'] == '10.244.1.59/24':
             #e['network'] = '10.244.1.0/24'
 
             if IPv4Address(address[0]) in IPv4Network(e['network']):
-                print(e)
+                log.debug('flags.team', ip=address[0], team=e['name'])
                 team = e
                 break
 
         if not bool(team):
+            log.warning('flags.unknown_team', ip=address[0])
+            FLAGS_REJECTED.labels('unknown_team').inc()
             connection.send(('Who are you?\n Goodbye\n').encode())
             connection.close()
         else:
+            FLAGS_CONNECTIONS.inc()
             try:
                 self.process_one_team(connection, team)
-            except BrokenPipeError:
-                print('Client is disconnected')
-                sys.exit(0)
+            except (BrokenPipeError, ConnectionResetError):
+                log.info('flags.disconnected', ip=address[0], team=team['name'])
+            finally:
+                FLAGS_CONNECTIONS.dec()
+                connection.close()
 
     def process_one_team(self, connection, team):
         connection.send(('Welcome! \nYour team - ' + team["name"] + '\n').encode())
 
         while True:
             data = connection.recv(1024)
+            if not data:
+                return
             data = str(data.rstrip().decode('utf-8'))
+            FLAGS_SUBMITTED.inc()
 
             if not re.match('^\w{33}=$',data):
+                FLAGS_REJECTED.labels('not_flag').inc()
                 connection.send(('this is not flag\n').encode())
                 continue
 
@@ -95,14 +106,17 @@ class Flags:
                     if f['flag'] == data.upper():
                         flag = f
                 if not bool(flag):
+                    FLAGS_REJECTED.labels('not_found').inc()
                     connection.send(('Flag is not found\n').encode())
                     continue
 
             if flag['team']['_id'] == team['_id']:
+                FLAGS_REJECTED.labels('own').inc()
                 connection.send(('It`s your flag\n').encode())
                 continue
 
             if (self.life + flag["timestamp"]) <= time.time():
+                FLAGS_REJECTED.labels('too_old').inc()
                 connection.send(('This flag is too old\n').encode())
                 continue
 
@@ -112,6 +126,7 @@ class Flags:
             })
 
             if status["status"] != 'UP':
+                FLAGS_REJECTED.labels('service_down').inc()
                 connection.send(('Your service '+ flag['service']['name'] +' is not working\n').encode())
                 continue
 
@@ -123,6 +138,7 @@ class Flags:
             })
 
             if is_stolen:
+                FLAGS_REJECTED.labels('already_passed').inc()
                 connection.send(('You are already pass this flag\n').encode())
                 continue
 
@@ -134,4 +150,5 @@ class Flags:
             })
 
             self.db.flags.update_one({'flag': data}, {"$set": {"stolen": True}})
+            FLAGS_ACCEPTED.inc()
             connection.send(('received\n').encode())
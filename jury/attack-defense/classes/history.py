@@ -0,0 +1,80 @@
+import time
+import pymongo
+
+from config.main import HISTORY
+
+
+# Журнал результатов чекеров.
+# Пишется в capped-коллекцию: запись O(1), старые записи вытесняются сами.
+# Ключи короткие, чтобы история за всю игру помещалась в коллекцию:
+#   r - раунд, t/tn - id/имя команды, s/sn - id/имя сервиса, a - действие
+#   (check, put, get, round - итог раунда), c - код, d - длительность (мс),
+#   o - обрезанный stdout чекера, ts - время записи
+class History:
+    collection = 'checker_log'
+
+    def __init__(self, db):
+        self.db = db
+        self.log = db[self.collection]
+
+    def create(self):
+        """Пересоздаёт коллекцию истории (вызывается при инициализации игры)"""
+        if self.collection in self.db.collection_names():
+            self.db.drop_collection(self.collection)
+
+        self.db.create_collection(self.collection, capped=True, size=HISTORY['SIZE'])
+        self.log = self.db[self.collection]
+        self.log.create_index([('t', pymongo.ASCENDING), ('r', pymongo.ASCENDING)])
+        self.log.create_index([('a', pymongo.ASCENDING), ('r', pymongo.ASCENDING)])
+
+    def record(self, round, team, service, action, code, duration, output=''):
+        if isinstance(output, bytes):
+            output = output.decode('utf-8', 'replace')
+
+        self.log.insert_one({
+            'r': round,
+            't': team['_id'],
+            'tn': team['name'],
+            's': service['_id'],
+            'sn': service['name'],
+            'a': action,
+            'c': code,
+            'd': int(duration * 1000),
+            'o': str(output)[:HISTORY['OUTPUT_LENGTH']],
+            'ts': time.time()
+        })
+
+    def last_round(self):
+        last = self.log.find({'a': 'round'}, {'r': 1}).sort([('a', pymongo.ASCENDING), ('r', pymongo.DESCENDING)]).limit(1)
+        for item in last:
+            return item['r']
+        return 0
+
+    def sla(self, rounds, last_round=None):
+        """SLA каждой пары команда/сервис за последние rounds раундов: {(team_id, service_id): 0..1}"""
+        if last_round is None:
+            last_round = self.last_round()
+        total = min(rounds, last_round)
+        if total <= 0:
+            return {}
+
+        result = self.log.aggregate([
+            {'$match': {'a': 'round', 'r': {'$gt': last_round - rounds, '$lte': last_round}}},
+            {'$group': {
+                '_id': {'t': '$t', 's': '$s'},
+                'up': {'$sum': {'$cond': [{'$eq': ['$c', 101]}, 1, 0]}}
+            }}
+        ])
+
+        return {(item['_id']['t'], item['_id']['s']): item['up'] / total for item in result}
+
+    def timeline(self, team_id, rounds, last_round=None, actions=None):
+        """Записи по команде за последние rounds раундов в порядке раундов"""
+        if last_round is None:
+            last_round = self.last_round()
+
+        query = {'t': team_id, 'r': {'$gt': last_round - rounds, '$lte': last_round}}
+        if actions:
+            query['a'] = {'$in': list(actions)}
+
+        return list(self.log.find(query, {'_id': 0}).sort([('t', pymongo.ASCENDING), ('r', pymongo.ASCENDING)]))
@@ -1,4 +1,6 @@
 from classes.config.put import Put as ConfigPut
+from classes.history import History
+from classes.scoring import Scoring
 import os, stat
 from functions import Message
 
@@ -27,6 +29,9 @@ class Initialize:
         self.db.scoreboard.delete_many({})
         self.db.flags.delete_many({})
         self.db.stolen_flags.delete_many({})
+        self.db.scores.delete_many({})
+        self.db.game.delete_many({})
+        History(self.db).create()
 
         Message.info('\tDone')
 
@@ -78,3 +83,5 @@ class Initialize:
                     'attack': 0,
                     'defense': 0
                 })
+
+        Scoring(self.db).close_round(0)
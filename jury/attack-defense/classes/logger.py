@@ -0,0 +1,138 @@
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+
+from bson import json_util
+from config.main import LOG
+from classes.metrics import registry
+
+LOG_RECORDS = registry.counter('jury_log_records_total', 'Log records by outcome', ['outcome'])
+
+LEVELS = {
+    'DEBUG': 10,
+    'INFO': 20,
+    'WARNING': 30,
+    'ERROR': 40
+}
+
+
+# Структурированный лог (JSON-lines). Запись в stdout/файл делает фоновый поток,
+# вызывающий код только кладёт запись в очередь и никогда не блокируется.
+class Logger:
+    def __init__(self, level='INFO', path=None, rate=0, burst=0, size=10000):
+        self.level = LEVELS[level]
+        self.path = path
+        self.rate = rate
+        self.burst = burst or rate
+        self.buckets = {}
+        self.suppressed = {}
+        self.queue = queue.Queue(maxsize=size)
+        self.thread = None
+        self.lock = threading.Lock()
+        # buckets и suppressed меняются из потоков приёма флагов и чекеров
+        self.rate_lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.writer, name='logger')
+                self.thread.daemon = True
+                self.thread.start()
+                # поток-писатель демонический: при выходе дописываем очередь сами
+                atexit.register(self.flush, 5)
+
+    def allow(self, event):
+        # token bucket на каждое событие
+        if not self.rate:
+            return True
+
+        with self.rate_lock:
+            now = time.monotonic()
+            tokens, last = self.buckets.get(event, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self.buckets[event] = (tokens, now)
+                self.suppressed[event] = self.suppressed.get(event, 0) + 1
+                return False
+            self.buckets[event] = (tokens - 1, now)
+            return True
+
+    def take_suppressed(self, event):
+        if not self.suppressed:
+            return 0
+        with self.rate_lock:
+            return self.suppressed.pop(event, 0)
+
+    def log(self, level, event, **fields):
+        if LEVELS[level] < self.level:
+            return
+        if not self.allow(event):
+            LOG_RECORDS.labels('limited').inc()
+            return
+
+        record = {'ts': time.time(), 'level': level, 'event': event}
+        record.update(fields)
+        suppressed = self.take_suppressed(event)
+        if suppressed:
+            record['suppressed'] = suppressed
+
+        if self.thread is None:
+            self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS.labels('dropped').inc()
+
+    def debug(self, event, **fields):
+        self.log('DEBUG', event, **fields)
+
+    def info(self, event, **fields):
+        self.log('INFO', event, **fields)
+
+    def warning(self, event, **fields):
+        self.log('WARNING', event, **fields)
+
+    def error(self, event, **fields):
+        self.log('ERROR', event, **fields)
+
+    def writer(self):
+        stream = open(self.path, 'a') if self.path else sys.stdout
+
+        while True:
+            lines = [self.queue.get()]
+            # Забираем всё, что накопилось, и пишем одной пачкой
+            while len(lines) < 1000:
+                try:
+                    lines.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            out = []
+            for record in lines:
+                try:
+                    out.append(json.dumps(record, default=json_util.default, ensure_ascii=False))
+                except (TypeError, ValueError):
+                    out.append(json.dumps({'ts': record['ts'], 'level': record['level'],
+                                           'event': record['event'], 'repr': repr(record)}))
+            try:
+                stream.write('\n'.join(out) + '\n')
+                stream.flush()
+                LOG_RECORDS.labels('written').inc(len(out))
+            except (OSError, ValueError):
+                LOG_RECORDS.labels('dropped').inc(len(out))
+            for _ in lines:
+                self.queue.task_done()
+
+    def flush(self, timeout=1):
+        """Ждёт, пока писатель запишет всё, что уже в очереди (не дольше timeout)"""
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            if self.thread is None or not self.thread.is_alive():
+                return
+            time.sleep(0.01)
+
+
+log = Logger(LOG['LEVEL'], LOG['FILE'], LOG['RATE'], LOG['BURST'], LOG['QUEUE_SIZE'])
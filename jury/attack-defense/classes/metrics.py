@@ -0,0 +1,296 @@
+from bisect import bisect_left
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+import threading
+import time
+
+from functions import Message
+
+
+# Общий реестр метрик для всех модулей жюри (flags, start, scoreboard, zond).
+# Отдаётся по HTTP в текстовом формате Prometheus.
+class Metric:
+    type = ''
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.children = {}
+        self.lock = threading.Lock()
+
+        if not self.labelnames:
+            self.default = self.labels()
+
+    def labels(self, *values):
+        child = self.children.get(values)
+        if child is None:
+            values = tuple(str(v) for v in values)
+            with self.lock:
+                child = self.children.get(values)
+                if child is None:
+                    if len(values) != len(self.labelnames):
+                        raise ValueError('Wrong label count for ' + self.name)
+                    child = self.new_child()
+                    self.children[values] = child
+        return child
+
+    def label_str(self, values, extra=()):
+        pairs = list(zip(self.labelnames, values)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join('%s="%s"' % (k, escape(v)) for k, v in pairs) + '}'
+
+    def expose(self):
+        lines = [
+            '# HELP %s %s' % (self.name, self.documentation),
+            '# TYPE %s %s' % (self.name, self.type)
+        ]
+        for values, child in sorted(self.children.items()):
+            lines.extend(self.expose_child(values, child))
+        return lines
+
+
+class CounterChild:
+    __slots__ = ('value', 'lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def new_child(self):
+        return CounterChild()
+
+    def inc(self, amount=1):
+        self.default.inc(amount)
+
+    def expose_child(self, values, child):
+        return ['%s%s %s' % (self.name, self.label_str(values), format_value(child.value))]
+
+
+class GaugeChild:
+    __slots__ = ('value', 'lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def set(self, value):
+        self.value = value
+
+
+class Gauge(Counter):
+    type = 'gauge'
+
+    def new_child(self):
+        return GaugeChild()
+
+    def set(self, value):
+        self.default.set(value)
+
+    def dec(self, amount=1):
+        self.default.dec(amount)
+
+
+class HistogramChild:
+    __slots__ = ('bounds', 'buckets', 'sum', 'lock')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect_left(self.bounds, value)
+        with self.lock:
+            self.buckets[i] += 1
+            self.sum += value
+
+    def time(self):
+        return Timer(self)
+
+
+class Timer:
+    __slots__ = ('child', 'start')
+
+    def __init__(self, child):
+        self.child = child
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.child.observe(time.perf_counter() - self.start)
+
+
+class Histogram(Metric):
+    type = 'histogram'
+    DEFAULT_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        Metric.__init__(self, name, documentation, labelnames)
+
+    def new_child(self):
+        return HistogramChild(self.bounds)
+
+    def observe(self, value):
+        self.default.observe(value)
+
+    def time(self):
+        return self.default.time()
+
+    def expose_child(self, values, child):
+        with child.lock:
+            buckets = list(child.buckets)
+            total = child.sum
+
+        lines = []
+        count = 0
+        for bound, n in zip(self.bounds + (float('inf'),), buckets):
+            count += n
+            lines.append('%s_bucket%s %d' % (self.name, self.label_str(values, [('le', format_value(bound))]), count))
+        lines.append('%s_sum%s %s' % (self.name, self.label_str(values), format_value(total)))
+        lines.append('%s_count%s %d' % (self.name, self.label_str(values), count))
+        return lines
+
+
+def escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self.server = None
+
+    def register(self, metric):
+        with self.lock:
+            if metric.name in self.metrics:
+                return self.metrics[metric.name]
+            self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=Histogram.DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def expose(self):
+        lines = []
+        for name in sorted(self.metrics):
+            lines.extend(self.metrics[name].expose())
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, host, port, count=1):
+        """Поднимает HTTP-сервер /metrics в фоновом потоке на первом свободном
+        порту из port..port+count-1 и возвращает его (или None)"""
+        if self.server is not None:
+            return self.server
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.expose().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        for port in range(port, port + count):
+            try:
+                self.server = ThreadedHTTPServer((host, port), Handler)
+                break
+            except OSError as e:
+                error = e
+        else:
+            Message.warning('Metrics endpoint is disabled: ' + str(error))
+            return None
+
+        thread = threading.Thread(target=self.server.serve_forever, name='metrics')
+        thread.daemon = True
+        thread.start()
+        Message.info('Metrics on http://%s:%d/metrics' % (host, port))
+        return self.server
+
+
+class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+# Слушатель событий pymongo: время выполнения команд Mongo
+try:
+    from pymongo import monitoring
+
+    class MongoListener(monitoring.CommandListener):
+        def started(self, event):
+            pass
+
+        def succeeded(self, event):
+            MONGO_LATENCY.labels(event.command_name, 'ok').observe(event.duration_micros / 1e6)
+
+        def failed(self, event):
+            MONGO_LATENCY.labels(event.command_name, 'error').observe(event.duration_micros / 1e6)
+except ImportError:
+    MongoListener = None
+
+
+registry = Registry()
+
+FLAGS_SUBMITTED = registry.counter('jury_flags_submitted_total', 'Flags submitted to the flag acceptor')
+FLAGS_ACCEPTED = registry.counter('jury_flags_accepted_total', 'Flags accepted as stolen')
+FLAGS_REJECTED = registry.counter('jury_flags_rejected_total', 'Flags rejected by the acceptor', ['reason'])
+FLAGS_CONNECTIONS = registry.gauge('jury_flags_connections', 'Open connections to the flag acceptor')
+
+CHECKER_DURATION = registry.histogram('jury_checker_duration_seconds', 'Checker run time',
+                                      ['service', 'action', 'result'])
+
+ROUND_PHASE = registry.histogram('jury_round_phase_seconds', 'Duration of round phases', ['phase'])
+ROUND_NUMBER = registry.gauge('jury_round', 'Current round number')
+ROUND_POINTS = registry.counter('jury_round_points_total', 'Attack/defense points awarded at round close', ['kind'])
+
+MONGO_LATENCY = registry.histogram('jury_mongo_op_seconds', 'MongoDB command latency', ['command', 'result'])
+
+QUEUE_DEPTH = registry.gauge('jury_queue_depth', 'Checker tasks waiting in the queue')
+ZOND_TASKS = registry.counter('jury_zond_tasks_total', 'Checker tasks received by the zond')
+
+SCOREBOARD_REQUESTS = registry.counter('jury_scoreboard_requests_total', 'Scoreboard requests', ['status'])
+SCOREBOARD_RENDER = registry.histogram('jury_scoreboard_render_seconds', 'Scoreboard render time')
@@ -1,8 +1,10 @@
 from config.main import CHECKER
 from functions import Message
+from classes.logger import log
 from classes.checker.threads import Threads
 from classes.statistic import Statistic
 from classes.config.get import ConfigGet
+from classes.metrics import ROUND_PHASE, ROUND_NUMBER
 
 import random
 import string
@@ -32,19 +34,28 @@ class Round:
         #TODO: косяк в status_service
         # Подводим итоги предыдущего раунда
 
-        self.statistic.summary(self.round_count)
+        with ROUND_PHASE.labels('summary').time():
+            self.statistic.summary(self.round_count)
         # Очищаем предыдущие задачи
         self.checkerManager.clear()
         self.round_count += 1
+        ROUND_NUMBER.set(self.round_count)
+        self.statistic.scoring.start_round(self.round_count)
 
-        Message.success('Round: ' + str(self.round_count))
+        log.info('round.start', round=self.round_count)
 
+        with ROUND_PHASE.labels('generate').time():
+            self.generate_tasks()
+        with ROUND_PHASE.labels('dispatch').time():
+            self.checkerManager.run()
+
+    def generate_tasks(self):
         for team in self.config.get_all_teams():
             for service in self.config.get_all_services():
                 flag = self.generate_flags()
                 flag_id = self.generate_flag_ids()
 
-                print(team['name'] + ' ' + service['name'] + ' ' + flag)
+                log.debug('round.task', round=self.round_count, team=team['name'], service=service['name'], flag=flag)
 
                 self.checkerManager.put(
                     team = team,
@@ -53,7 +64,6 @@ class Round:
                     flag_id = flag_id,
                     round = self.round_count
                 )
-        self.checkerManager.run()
 
 
     def generate_flags(self):
@@ -2,44 +2,125 @@ from flask import Flask
 from flask import render_template
 from flask import jsonify
 from flask import request
+from flask import Response
+from flask import abort
 
 import pymongo
 import json
 
+from bson import ObjectId
+from config.main import CHECKER, SCOREBOARD, SCOREBOARD_API
+
+from classes.metrics import SCOREBOARD_REQUESTS, SCOREBOARD_RENDER
+from classes.scoring import Scoring
+from classes.history import History
+from classes.apicache import ApiCache
+
 
 class Scoreboard:
 
     def __init__(self, db):
         self.db = db
+        self.scoring = Scoring(db)
+        self.history = History(db)
+        self.cache = ApiCache(db, SCOREBOARD_API['CHECK_INTERVAL'], SCOREBOARD_API['CACHE_SIZE'])
 
         self.app = Flask(__name__)
+        self.routes()
 
-    def sort_team(self, service):
-        count = 0
-        team_name, services = service
-
-        for service in services:
-            #count += round((services[service]['uptime'] * (int(services[service]['attack']) + int(services[service]['defense'])) * 0.01), 2)
-            count += int(services[service]['attack']) + int(services[service]['defense'])
-
-
-        return count
     def sort_service(self, service):
-        print('service')
-        print(service)
         return 1
+
+    def int_arg(self, name, default, maximum):
+        try:
+            value = int(request.args.get(name, default))
+        except ValueError:
+            abort(400)
+        return max(1, min(value, maximum))
+
+    def json_response(self, entry):
+        headers = {
+            'Cache-Control': 'public, max-age=%d' % SCOREBOARD_API['MAX_AGE'],
+            'Vary': 'Accept-Encoding'
+        }
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            body, etag = entry.gzip_body, entry.gzip_etag
+            headers['Content-Encoding'] = 'gzip'
+        else:
+            body, etag = entry.body, entry.etag
+        headers['ETag'] = etag
+
+        if etag in request.headers.get('If-None-Match', ''):
+            headers.pop('Content-Encoding', None)
+            return Response(status=304, headers=headers)
+
+        return Response(body, status=200, headers=headers, mimetype='application/json')
+
+    def statuses(self):
+        status = {}
+        for item in self.db.scoreboard.find({}, {'team._id': 1, 'service.name': 1, 'status': 1, 'message': 1}):
+            status[(item['team']['_id'], item['service']['name'])] = item
+        return status
+
+    def api_scoreboard(self, page, per_page):
+        ranking = self.scoring.ranking()
+        rows = ranking[(page - 1) * per_page:page * per_page]
+        status = self.statuses()
+
+        for row in rows:
+            for name, service in row['services'].items():
+                service['status'] = status.get((row['_id'], name), {'status': 'DOWN'})['status']
+
+        return {
+            'round': self.scoring.current_round(),
+            'page': page,
+            'per_page': per_page,
+            'total': len(ranking),
+            'teams': [{
+                'id': str(row['_id']),
+                'name': row['name'],
+                'host': row['host'],
+                'rank': row['rank'],
+                'score': row['score'],
+                'attack': row['attack'],
+                'defense': row['defense'],
+                'stolen': row.get('stolen', 0),
+                'services': row['services']
+            } for row in rows]
+        }
+
+    def api_history(self, team_id, rounds):
+        # несуществующие команды не попадают в кэш
+        if self.db.teams.find_one({'_id': team_id}, {'_id': 1}) is None:
+            abort(404)
+        return {
+            'team': str(team_id),
+            'rounds': rounds,
+            'history': self.history.timeline(team_id, rounds)
+        }
+
+    def api_round(self):
+        game = self.db.game.find_one({'_id': 'round'}) or {}
+        return {
+            'current': game.get('current', 0),
+            'closed': game.get('closed', 0),
+            'started_at': game.get('started_at'),
+            'round_length': CHECKER['ROUND_LENGTH']
+        }
     """ Seee http://flask.pocoo.org/docs/0.10/tutorial/dbcon/#tutorial-dbcon """
-    def start(self):
+    def routes(self):
         @self.app.route("/")
         def index():
-            try:
-                scoreboard = self.db.scoreboard.find()
+            with SCOREBOARD_RENDER.time():
+                return render_index()
 
+        def render_index():
+            try:
                 #if scoreboard.count() == 0:
                     # Хотелось бы добавить сюда время начала соревнований
                 #    return render_template('game_not_started.html')
 
-                sc = {}
+                sc = []
                 teams = {}
 
                 color = {'UP':'success', 'DOWN':'danger', 'CORRUPT':'warning' ,'MUMBLE':'info'}
@@ -48,31 +129,29 @@ class Scoreboard:
                 if visitor_team == None:
                     visitor_team = {'_id': ''}
 
-                count_round = self.db.flags.find().sort([ ('round', pymongo.DESCENDING) ]).limit(1)[0]['round']
-
-                for item in scoreboard:
-                    team_name = item['team']['name']
-                    if team_name not in sc:
-                        sc[team_name] = {}
-                        teams[team_name] = item['team']
-                        teams[team_name]['score'] = 0
+                count_round = self.scoring.current_round()
 
-                    sc[team_name][item['service']['name']] = {
-                        'status': item['status'],
-                        'own': item['team']['_id'] == visitor_team['_id'],
-                        'message': item['message'],
-                        'attack': str(item['attack']),
-                        'defense': str(item['defense']),
-                        'up_round': int(item['up_round']),
-                        'uptime': (item['up_round'] / count_round) * 100
-                    }
-                    uptime = (item['up_round'] / count_round) * 100
+                # Текущий статус сервисов, очки и места уже посчитаны в scores
+                status = self.statuses()
 
-                    teams[team_name]['score'] += round((uptime * (item['attack'] + item['defense']) * 0.01), 2)
-                    teams[team_name]['score'] = round(teams[team_name]['score'], 2)
+                for row in self.scoring.ranking():
+                    services = {}
+                    for name, service in row['services'].items():
+                        item = status.get((row['_id'], name), {'status': 'DOWN', 'message': ''})
+                        services[name] = {
+                            'status': item['status'],
+                            'own': row['_id'] == visitor_team['_id'],
+                            'message': item['message'],
+                            'attack': str(service['attack']),
+                            'defense': str(service['defense']),
+                            'up_round': int(service['up_round']),
+                            'uptime': service['uptime']
+                        }
 
-                sc = sorted(sc.items(), key=self.sort_team)[::-1]
+                    sc.append((row['name'], services))
+                    teams[row['name']] = row
 
+                SCOREBOARD_REQUESTS.labels('ok').inc()
 
                 return render_template('index.html',
                                        scoreboard=sc,
@@ -82,7 +161,69 @@ class Scoreboard:
                                        services={'history':{}, 'crypto-inc':{}, 'support':{}, 'loogles':{}, 'runaway': {} }
                                        )
             except Exception:
+                SCOREBOARD_REQUESTS.labels('error').inc()
                 return render_template('is_not_avialable.html')
 
-        self.app.debug = True
-        self.app.run(host="0.0.0.0", port=9000, threaded=True)
+        @self.app.route("/api/scoreboard")
+        def api_scoreboard():
+            page = self.int_arg('page', 1, 100000)
+            per_page = self.int_arg('per_page', SCOREBOARD_API['PER_PAGE'], SCOREBOARD_API['MAX_PER_PAGE'])
+
+            return self.json_response(self.cache.get(('scoreboard', page, per_page),
+                                                     lambda: self.api_scoreboard(page, per_page)))
+
+        @self.app.route("/api/teams/<team_id>/history")
+        def api_history(team_id):
+            if not ObjectId.is_valid(team_id):
+                abort(404)
+            rounds = self.int_arg('rounds', 10, SCOREBOARD_API['MAX_ROUNDS'])
+
+            return self.json_response(self.cache.get(('history', team_id, rounds),
+                                                     lambda: self.api_history(ObjectId(team_id), rounds)))
+
+        @self.app.route("/api/round")
+        def api_round():
+            return self.json_response(self.cache.get(('round',), self.api_round))
+
+    def start(self):
+        """ Werkzeug dev server; for the game use serve() """
+        self.app.debug = SCOREBOARD['DEBUG']
+        self.app.run(host=SCOREBOARD['HOST'], port=SCOREBOARD['PORT'], threaded=True)
+
+    def serve(self, workers=None, threads=None):
+        """ gunicorn: pre-fork workers with threads, keep-alive; SIGHUP restarts the workers (same code) """
+        from gunicorn.app.base import BaseApplication
+
+        app = self.app
+
+        workers = workers or SCOREBOARD['WORKERS']
+
+        def post_fork(server, worker):
+            # У каждого воркера свой реестр и свой /metrics: первый свободный
+            # порт диапазона, после перезапуска воркера порт занимает замена
+            from config.main import METRICS
+            from classes.metrics import registry
+            registry.server = None
+            registry.serve(METRICS['HOST'], METRICS['PORT']['scoreboard_workers'], workers)
+
+        settings = {
+            'post_fork': post_fork,
+            'bind': '%s:%d' % (SCOREBOARD['HOST'], SCOREBOARD['PORT']),
+            'workers': workers,
+            'threads': threads or SCOREBOARD['THREADS'],
+            'worker_class': 'gthread',
+            'keepalive': SCOREBOARD['KEEPALIVE'],
+            'timeout': 30,
+            'graceful_timeout': 30,
+            'proc_name': 'jury-scoreboard'
+        }
+
+        class Application(BaseApplication):
+            def load_config(self):
+                for key, value in settings.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                return app
+
+        Application().run()
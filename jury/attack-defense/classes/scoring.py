@@ -0,0 +1,81 @@
+import time
+import pymongo
+
+from pymongo import UpdateOne
+
+
+# Единственное место, где считаются очки команд.
+# Итоги хранятся в коллекции scores (одна запись на команду, уже с местом rank),
+# поэтому таблица результатов, API и итоги раунда только читают готовые данные.
+# Очки, как и раньше, начисляются только при закрытии раунда (атака засчитывается
+# с задержкой в CHECKER['LENGTH'] раундов), так что между закрытиями итоги не меняются.
+class Scoring:
+    def __init__(self, db):
+        self.db = db
+
+    @staticmethod
+    def uptime(up_round, count_round):
+        return up_round / count_round if count_round else 0
+
+    @staticmethod
+    def service_score(up_round, attack, defense, count_round):
+        return round(Scoring.uptime(up_round, count_round) * (attack + defense), 2)
+
+    def close_round(self, count_round):
+        """Пересчитывает очки по итогам раунда и обновляет места команд"""
+        teams = {}
+        for item in self.db.scoreboard.find({}, {'team': 1, 'service.name': 1, 'up_round': 1, 'attack': 1, 'defense': 1}):
+            team = item['team']
+            if team['_id'] not in teams:
+                teams[team['_id']] = {
+                    'name': team['name'],
+                    'host': team.get('host', ''),
+                    'score': 0,
+                    'attack': 0,
+                    'defense': 0,
+                    'services': {}
+                }
+            row = teams[team['_id']]
+
+            row['score'] += self.service_score(item['up_round'], item['attack'], item['defense'], count_round)
+            row['attack'] += item['attack']
+            row['defense'] += item['defense']
+            row['services'][item['service']['name']] = {
+                'up_round': item['up_round'],
+                'uptime': self.uptime(item['up_round'], count_round) * 100,
+                'attack': item['attack'],
+                'defense': item['defense']
+            }
+
+        # Сданные флаги считаются тут же, чтобы все поля записи были на один раунд
+        stolen = {item['_id']: item['count'] for item in self.db.stolen_flags.aggregate([
+            {'$group': {'_id': '$team._id', 'count': {'$sum': 1}}}
+        ])}
+        for team_id, row in teams.items():
+            row['stolen'] = stolen.get(team_id, 0)
+
+        ranking = sorted(teams.items(), key=lambda e: (-e[1]['score'], e[1]['name']))
+
+        requests = []
+        for place, (team_id, row) in enumerate(ranking, 1):
+            row['score'] = round(row['score'], 2)
+            row['rank'] = place
+            row['round'] = count_round
+            requests.append(UpdateOne({'_id': team_id}, {'$set': row}, upsert=True))
+
+        if requests:
+            self.db.scores.bulk_write(requests, ordered=False)
+
+        self.db.game.update_one({'_id': 'round'}, {'$set': {'closed': count_round, 'closed_at': time.time()}}, upsert=True)
+
+        return [row for team_id, row in ranking]
+
+    def start_round(self, count_round):
+        self.db.game.update_one({'_id': 'round'}, {'$set': {'current': count_round, 'started_at': time.time()}}, upsert=True)
+
+    def ranking(self):
+        return list(self.db.scores.find().sort([('rank', pymongo.ASCENDING)]))
+
+    def current_round(self):
+        game = self.db.game.find_one({'_id': 'round'})
+        return game.get('current', 0) if game else 0
@@ -1,4 +1,7 @@
 from config.main import CHECKER
+from classes.metrics import ROUND_POINTS
+from classes.logger import log
+from classes.scoring import Scoring
 
 class Statistic:
     codes = {
@@ -11,8 +14,7 @@ class Statistic:
     def __init__(self, db, config):
         self.db = db
         self.config = config
-
-        pass
+        self.scoring = Scoring(db)
 
     # Подводим итоги последнего раунда и сохраняем в базу
     def summary(self, round):
@@ -21,7 +23,7 @@ class Statistic:
         for item in scoreboard:
             status_service[item['team']['name'] + '_' + item['service']['name']] = self.codes[item['status']]
 
-        print(status_service)
+        log.debug('round.summary', round=round, status=status_service)
         for team in self.config.get_all_teams():
             for service in self.config.get_all_services():
                 last_legacy_round = round - CHECKER['LENGTH']
@@ -42,6 +44,9 @@ class Statistic:
                 else:
                     count_defense = 0
 
+                ROUND_POINTS.labels('attack').inc(count_attack)
+                ROUND_POINTS.labels('defense').inc(count_defense)
+
                 self.db.scoreboard.update_one(
                     {
                         'team._id': team['_id'],
@@ -54,3 +59,6 @@ class Statistic:
                         }
                     }
                 )
+
+        ranking = self.scoring.close_round(round)
+        log.info('round.ranking', round=round, top=[(row['name'], row['score']) for row in ranking[:3]])
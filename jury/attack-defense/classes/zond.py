@@ -6,8 +6,12 @@ import pika, time, json
 
 from bson import json_util
 from functions import Message
+from classes.logger import log
 from classes.checker.main import Checker
+from classes.checker.probe import Probe
+from classes.history import History
 from config.main import QUEUE
+from classes.metrics import CHECKER_DURATION, QUEUE_DEPTH, ZOND_TASKS
 
 try:
     import thread
@@ -30,12 +34,16 @@ class Zond:
     def __init__(self, db):
         self.db = db
         self.checker = Checker()
+        self.history = History(db)
+        self.probe = Probe()
         connection = pika.BlockingConnection(pika.ConnectionParameters(
             host=QUEUE['HOST']
 #            credentials=pika.credentials.PlainCredentials(QUEUE['USERNAME'], QUEUE['PASSWORD'])
         ))
+        self.connection = connection
         self.channel = connection.channel()
         self.channel.queue_declare(queue=QUEUE['QNAME'])
+        self.sample_queue_depth()
         print(' [*] Waiting for messages. To exit press CTRL+C')
 
     def run(self):
@@ -44,10 +52,20 @@ class Zond:
                               no_ack=True)
         self.channel.start_consuming()
 
+    # Глубина очереди снимается по таймеру в потоке соединения,
+    # а не отдельным запросом к брокеру на каждое сообщение
+    def sample_queue_depth(self):
+        try:
+            QUEUE_DEPTH.set(self.channel.queue_declare(queue=QUEUE['QNAME'], passive=True).method.message_count)
+        except Exception as e:
+            log.warning('zond.queue_depth', error=str(e))
+        self.connection.add_timeout(QUEUE.get('DEPTH_INTERVAL', 5), self.sample_queue_depth)
+
     def callback(self, ch, method, properties, body):
         data = json.loads(body.decode('utf8'))
+        ZOND_TASKS.inc()
 
-        print(" [x] Received %r %r" % (data['team']['name'],data['service']['name']))
+        log.info('zond.received', round=data['round'], team=data['team']['name'], service=data['service']['name'])
 
         if not os.path.exists('checkers/' + data['service']['name'] + '/checker'):
             if not os.path.exists('checkers/' + data['service']['name']):
@@ -109,21 +127,61 @@ class Zond:
         path = self.path_to_checkers + service['name'] + '/' + self.filename_checkers
 
         action = ''
+        started = time.perf_counter()
         try:
-            action = 'check'
-            self.checker.check(team['host'], path)
-            action = 'put'
-            self.checker.put(team['host'], path, flag, flag_id)
-            action = 'get'
-            self.checker.get(team['host'], path, flag, flag_id)
-            self.update_scoreboard(team, service, 101)
+            action = 'probe'
+            if self.probe.is_down(round, service, team['host'], self.team_hosts):
+                raise Exception(104, 'Host unreachable: port %s is closed' % service['port'])
+            if service.get('round'):
+                action = 'round'
+                self.round_step(round, team, service, path, flag, flag_id)
+            else:
+                action = 'check'
+                self.step(round, team, service, action, self.checker.check, team['host'], path)
+                action = 'put'
+                self.step(round, team, service, action, self.checker.put, team['host'], path, flag, flag_id)
+                action = 'get'
+                self.step(round, team, service, action, self.checker.get, team['host'], path, flag, flag_id)
+            code, message = 101, ''
 
         except Exception as error:
             code, message = error.args
-            print(error)
-            Message.fail(team['name'] + ' ' + service['name'] + ' ' + action + ' => error (message: ' + str(message) + ')')
-            self.update_scoreboard(team, service, code, message)
+            log.warning('checker.fail', round=round, team=team['name'], service=service['name'],
+                        action=action, code=code, message=message)
 
+        # Итог раунда по сервису - по нему считается SLA
+        self.history.record(round, team, service, 'round', code, time.perf_counter() - started, message)
+        self.update_scoreboard(team, service, code, message)
+
+    def team_hosts(self):
+        return [team['host'] for team in self.db.teams.find({}, {'host': 1})]
+
+    # Один вызов чекера: метрика + запись в историю
+    def step(self, round, team, service, action, method, *args):
+        started = time.perf_counter()
+        code, output = 101, ''
+        try:
+            output = method(*args)
+        except Exception as error:
+            code, output = error.args if len(error.args) == 2 else (104, str(error))
+            raise Exception(code, output)
+        finally:
+            duration = time.perf_counter() - started
+            CHECKER_DURATION.labels(service['name'], action, self.codes.get(code, 'DOWN')).observe(duration)
+            self.history.record(round, team, service, action, code, duration, output)
+        return output
+
+    # Все три шага одним запуском чекера; метрики и история - по каждому шагу
+    def round_step(self, round, team, service, path, flag, flag_id):
+        code, output, steps = self.checker.round(team['host'], path, flag, flag_id)
+        for e, step in enumerate(steps):
+            CHECKER_DURATION.labels(service['name'], step['action'],
+                                    self.codes.get(step['code'], 'DOWN')).observe(step['time'])
+            self.history.record(round, team, service, step['action'], step['code'], step['time'],
+                                output if e == len(steps) - 1 else '')
+        if code != 101:
+            raise Exception(code, output)
+        return output
 
     def update_scoreboard(self, team, service, status_code, message=''):
         codes = {
@@ -136,7 +194,7 @@ class Zond:
         # self.status_service[team['name'] + '_' + service['name']] = status_code
 
         if status_code not in codes:
-            Message.fail('\t Invalid checker return code for ' + service['name'])
+            log.error('checker.invalid_code', service=service['name'], code=status_code)
             status_code = 104
 
         self.db.scoreboard.update_one(
@@ -154,3 +212,6 @@ class Zond:
                 }
             }
         )
+
+        # Версия таблицы для кэша API
+        self.db.game.update_one({'_id': 'round'}, {'$inc': {'changes': 1}}, upsert=True)
@@ -10,7 +10,8 @@ DATABASE = {
 CHECKER = {
 	'ROUND_LENGTH': 60, # в секундах
 	'LENGTH': 4, # Время жизни флага в раундах
-	'METHOD': 'queue' # async or queue
+	'METHOD': 'queue', # async or queue
+	'PROBE_TIMEOUT': 2 # секунд на TCP connect к порту сервиса (services[].port в game.json)
 }
 
 # конфигруация для RabbitMQ
@@ -18,7 +19,8 @@ QUEUE = {
 	'HOST': 'localhost',
 	'USERNAME': 'user',
 	'PASSWORD': 'StrongPassword',
-	'QNAME': 'tasks'
+	'QNAME': 'tasks',
+	'DEPTH_INTERVAL': 5 # секунд между замерами глубины очереди для /metrics
 }
 
 # конфигурация для метода взятия конфига с API
@@ -28,3 +30,50 @@ API = {
 }
 
 BASE_PATH = os.path.dirname(__file__) + '/../'
+
+# HTTP-эндпоинт /metrics (формат Prometheus) для каждого модуля
+METRICS = {
+	'HOST': '127.0.0.1',
+	'PORT': {
+		'flags': 9101,
+		'scoreboard': 9102, # python3 main.py scoreboard --dev
+		'scoreboard_workers': 9110, # gunicorn: 9110, 9111, ... по порту на воркер
+		'start': 9103,
+		'slave': 9104
+	}
+}
+
+# Структурированный лог (JSON-lines) с фоновой записью
+LOG = {
+	'LEVEL': 'INFO', # DEBUG, INFO, WARNING, ERROR
+	'FILE': None, # None - stdout
+	'RATE': 50, # записей в секунду на одно событие, 0 - без ограничения
+	'BURST': 200,
+	'QUEUE_SIZE': 10000
+}
+
+# История результатов чекеров (capped-коллекция checker_log)
+HISTORY = {
+	'SIZE': 256 * 1024 * 1024, # размер коллекции в байтах
+	'OUTPUT_LENGTH': 512 # сколько символов stdout чекера сохранять
+}
+
+# JSON API таблицы результатов (/api/scoreboard, /api/teams/<id>/history, /api/round)
+SCOREBOARD_API = {
+	'MAX_AGE': 5, # Cache-Control max-age, секунды
+	'CHECK_INTERVAL': 0.5, # как часто проверять версию игры в базе, секунды
+	'PER_PAGE': 50,
+	'MAX_PER_PAGE': 200,
+	'MAX_ROUNDS': 100,
+	'CACHE_SIZE': 1024 # готовых ответов в кэше, лишние вытесняются (LRU)
+}
+
+# Таблица результатов: gunicorn (pre-fork), `main.py scoreboard --dev` - dev-сервер Werkzeug
+SCOREBOARD = {
+	'HOST': '0.0.0.0',
+	'PORT': 9000,
+	'WORKERS': 4,
+	'THREADS': 8,
+	'KEEPALIVE': 5,
+	'DEBUG': False
+}
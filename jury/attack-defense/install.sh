@@ -9,6 +9,7 @@ function install_python_deps {
     sudo pip3 install requests
     sudo pip install --upgrade pip setuptools
     sudo pip3 install flask
+    sudo pip3 install gunicorn
     sudo pip3 install pika
 }
 
@@ -1,10 +1,12 @@
 from config.main import *
 from pymongo import MongoClient
+from classes.metrics import registry, MongoListener
 
 import functions
 import argparse
 
-client = MongoClient(host=DATABASE['HOST'], port=DATABASE['PORT'], Connect=False)
+client = MongoClient(host=DATABASE['HOST'], port=DATABASE['PORT'], Connect=False,
+                     event_listeners=[MongoListener()])
 #client.jury.authenticate(DATABASE['USER'], DATABASE['PASSWORD'])
 db = client.jury
 
@@ -15,6 +17,8 @@ def init(parse):
 
 
 def start(parse):
+    registry.serve(METRICS['HOST'], METRICS['PORT']['slave' if parse.slave else 'start'])
+
     if parse.slave:
         from classes.zond import Zond
 
@@ -34,6 +38,8 @@ def start(parse):
 def flags(parse):
     from classes.flags import Flags
 
+    registry.serve(METRICS['HOST'], METRICS['PORT']['flags'])
+
     flags = Flags(db)
     flags.start()
 
@@ -42,7 +48,33 @@ def scoreboard(parse):
     from classes.scoreboard import Scoreboard
 
     scoreboard = Scoreboard(db)
-    scoreboard.start()
+    if parse.dev:
+        registry.serve(METRICS['HOST'], METRICS['PORT']['scoreboard'])
+        scoreboard.start()
+    else:
+        scoreboard.serve(parse.workers, parse.threads)
+
+def history(parse):
+    from classes.history import History
+
+    team = db.teams.find_one({'name': parse.team})
+    if team is None:
+        functions.Message.fail('Team not found: ' + parse.team)
+        return
+
+    history = History(db)
+    last_round = history.last_round()
+
+    services = {}
+    for service in db.services.find():
+        services[service['_id']] = service['name']
+
+    for (team_id, service_id), sla in sorted(history.sla(parse.rounds, last_round).items()):
+        if team_id == team['_id']:
+            functions.Message.success('SLA %s: %.1f%%' % (services.get(service_id, service_id), sla * 100))
+
+    for item in history.timeline(team['_id'], parse.rounds, last_round):
+        print('%4d %-12s %-6s %d %6dms %s' % (item['r'], item['sn'], item['a'], item['c'], item['d'], item['o'].strip()))
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='The platform for the CTF-competition (Attack-Defense)',
@@ -63,8 +95,16 @@ if __name__ == '__main__':
     sp_flags.set_defaults(func=flags)
 
     sp_scoreboard = sp.add_parser('scoreboard', help='Run scoreboard')
+    sp_scoreboard.add_argument('--dev', help='Run on the Werkzeug dev server', action='store_true')
+    sp_scoreboard.add_argument('--workers', help='number of worker processes', type=int)
+    sp_scoreboard.add_argument('--threads', help='number of threads per worker', type=int)
     sp_scoreboard.set_defaults(func=scoreboard)
 
+    sp_history = sp.add_parser('history', help='Show checker results and SLA of the team')
+    sp_history.add_argument('team', help='team name')
+    sp_history.add_argument('--rounds', help='number of last rounds', type=int, default=10)
+    sp_history.set_defaults(func=history)
+
     if 'func' in parser.parse_args():
         parser.parse_args().func(parser.parse_args())
     else:
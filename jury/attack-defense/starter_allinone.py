@@ -41,7 +41,16 @@ def processIsRun(pid):
 	return True
 
 def printMessage(command, s):
-	s2 = command + ": [" + str(datetime.datetime.now()) + "] " + s
+	# Структурированные записи (JSON-lines) пропускаем как есть, добавив имя модуля
+	if s.startswith('{'):
+		try:
+			record = json.loads(s)
+			record['module'] = command
+			s2 = json.dumps(record, ensure_ascii=False)
+		except ValueError:
+			s2 = command + ": [" + str(datetime.datetime.now()) + "] " + s
+	else:
+		s2 = command + ": [" + str(datetime.datetime.now()) + "] " + s
 	logfile.write(s2 + "\n");
 	print(s2)
 
@@ -0,0 +1,150 @@
+"""attachments.py -- storage and delivery of task attachments
+
+Files are stored under static/files/ by content hash, so a name never
+changes its content and can be cached forever by browsers and proxies.
+Compressible files get a precompressed .gz twin.
+
+By default (config.json, nginx.conf) the download is handed to nginx
+with X-Accel-Redirect: Python only builds the headers and nginx streams
+the file, with ranges and conditional requests, from an internal
+location on static/files:
+
+    location /protected-files/ {
+        internal;
+        alias /path/to/task-based/static/files/;
+        expires max;
+    }
+
+X-Sendfile ("xSendfile": true) does the same for Apache/lighttpd. With
+neither set, send_file serves the file from the app: it supports ranges
+and conditional requests, but every download holds a gunicorn thread
+until the last byte is sent, so a few slow clients on a big file take
+up all threads of a worker. Use that only without a front proxy.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import shutil
+import tempfile
+
+from flask import current_app
+from flask import request
+from flask import send_file
+
+FILES_DIR = os.path.join("static", "files")
+CHUNK = 1024 * 1024
+MAX_AGE = 365 * 24 * 3600
+
+# Already compressed formats are not worth a .gz twin
+COMPRESSED = set(['.zip', '.rar', '.7z', '.gz', '.tgz', '.bz2', '.xz',
+    '.png', '.jpg', '.jpeg', '.gif', '.mp3', '.mp4', '.pdf', '.docx'])
+
+def store(stream, original_name):
+    """Saves a file-like object under its content hash and returns the name"""
+
+    ext = os.path.splitext(original_name)[1].lower()
+    digest = hashlib.sha256()
+
+    fd, tmp_path = tempfile.mkstemp(dir=FILES_DIR, prefix='.upload-')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            while True:
+                chunk = stream.read(CHUNK)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                tmp.write(chunk)
+
+        filename = digest.hexdigest()[:32] + ext
+        path = os.path.join(FILES_DIR, filename)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+            os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    precompress(path)
+    return filename
+
+def store_path(path):
+    """Same as store() for a file on disk"""
+
+    with open(path, 'rb') as f:
+        return store(f, os.path.basename(path))
+
+def hashed_name(path):
+    """Name store_path() would give the file, without copying it"""
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:32] + os.path.splitext(path)[1].lower()
+
+def precompress(path):
+    """Writes path + '.gz' if the file compresses by at least 10%"""
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext in COMPRESSED or os.path.exists(path + '.gz'):
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=FILES_DIR, prefix='.gzip-')
+    with open(path, 'rb') as src, os.fdopen(fd, 'wb') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=9, mtime=0) as dst:
+            shutil.copyfileobj(src, dst, CHUNK)
+
+    if os.path.getsize(tmp_path) < os.path.getsize(path) * 0.9:
+        os.chmod(tmp_path, 0o644)
+        os.rename(tmp_path, path + '.gz')
+    else:
+        os.remove(tmp_path)
+
+def remove(filename):
+    """Deletes an attachment and its .gz twin"""
+
+    for path in (os.path.join(FILES_DIR, filename),
+            os.path.join(FILES_DIR, filename + '.gz')):
+        if os.path.exists(path):
+            os.remove(path)
+
+def serve(filename, accel_prefix=None):
+    """Builds the response for /files/<filename>"""
+
+    path = os.path.join(FILES_DIR, filename)
+    if os.path.basename(filename) != filename or filename.startswith('.') \
+            or not os.path.isfile(path):
+        return None
+
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    encoding = None
+    if 'gzip' in request.headers.get('Accept-Encoding', '') \
+            and 'Range' not in request.headers \
+            and os.path.isfile(path + '.gz'):
+        path = path + '.gz'
+        encoding = 'gzip'
+
+    if accel_prefix:
+        # nginx streams the file itself from an internal location on
+        # static/files and takes care of ranges and conditional requests
+        response = current_app.response_class()
+        response.headers['Content-Type'] = mimetype
+        response.headers['Content-Disposition'] = 'attachment; filename=%s' % filename
+        response.headers['X-Accel-Redirect'] = accel_prefix + os.path.basename(path)
+    else:
+        response = send_file(path, mimetype=mimetype, as_attachment=True,
+            attachment_filename=filename, conditional=True)
+
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Accept-Ranges'] = 'bytes'
+    response.cache_control.public = True
+    response.cache_control.max_age = MAX_AGE
+    response.headers['Cache-Control'] += ', immutable'
+    return response
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""bench_scoreboard.py -- compares the aggregate scoreboard with the materialized one
+
+Builds a throwaway SQLite database with the buildTables.sh schema, plays
+N users x M tasks worth of submissions and times both scoreboard
+strategies. Only the standard library is needed:
+
+    python bench_scoreboard.py [--users 500] [--tasks 50] [--reads 200]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+import scores
+
+TABLES = [
+    'CREATE TABLE categories ( id INTEGER PRIMARY KEY, name TEXT )',
+    '''CREATE TABLE tasks (id INTEGER PRIMARY KEY, name TEXT, desc TEXT, hint TEXT, solve TEXT,
+        author TEXT, file TEXT, flag TEXT, score INT, category INT,
+        FOREIGN KEY(category) REFERENCES categories(id) ON DELETE CASCADE)''',
+    '''CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT NOT NULL, email TEXT,
+        isAdmin BOOLEAN, isHidden BOOLEAN, affilation TEXT, lineup TEXT, password TEXT,
+        "logo" TEXT NOT NULL DEFAULT "teams/404.png")''',
+    '''CREATE TABLE flags (task_id INTEGER, user_id INTEGER, score INTEGER, timestamp BIGINT,
+        ip TEXT, PRIMARY KEY (task_id, user_id),
+        FOREIGN KEY(task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+        FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE)''',
+]
+
+OLD_QUERY = '''select u.username, u.affilation, u.logo, ifnull(sum(f.score), 0) as score,
+    max(timestamp) as last_submit from users u left join flags f
+    on u.id = f.user_id where u.isHidden = 0 group by u.username
+    order by score desc, last_submit asc'''
+
+VERSION_QUERY = "SELECT value FROM meta WHERE key = 'scoreboard_version'"
+
+
+def timed(fn, count):
+    started = time.perf_counter()
+    for i in range(count):
+        fn()
+    return (time.perf_counter() - started) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--tasks', type=int, default=50)
+    parser.add_argument('--solve-rate', type=float, default=0.5)
+    parser.add_argument('--reads', type=int, default=200)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    conn = sqlite3.connect(path)
+    for statement in TABLES + scores.SCHEMA:
+        conn.execute(statement)
+
+    conn.execute("INSERT INTO categories (id, name) VALUES (1, 'bench')")
+    conn.executemany("INSERT INTO tasks (id, name, score, category, flag) VALUES (?, ?, ?, 1, 'x')",
+        [(t, 'task%d' % t, 100 * (1 + t % 5)) for t in range(1, args.tasks + 1)])
+    conn.executemany("INSERT INTO users (id, username, isAdmin, isHidden) VALUES (?, ?, 0, 0)",
+        [(u, 'user%d' % u) for u in range(1, args.users + 1)])
+    conn.commit()
+
+    solves = [(t, u) for u in range(1, args.users + 1) for t in range(1, args.tasks + 1)
+        if random.random() < args.solve_rate]
+    random.shuffle(solves)
+
+    # submissions: plain insert vs insert + score update in one transaction
+    half = len(solves) // 2
+    started = time.perf_counter()
+    for t, u in solves[:half]:
+        with conn:
+            conn.execute("INSERT INTO flags VALUES (?, ?, ?, ?, '127.0.0.1')", (t, u, 100, int(time.time() * 1000)))
+    plain = (time.perf_counter() - started) / half
+
+    started = time.perf_counter()
+    for t, u in solves[half:]:
+        ts = int(time.time() * 1000)
+        with conn:
+            conn.execute("INSERT INTO flags VALUES (?, ?, ?, ?, '127.0.0.1')", (t, u, 100, ts))
+            conn.execute("INSERT OR IGNORE INTO scores (user_id, score, last_submit) VALUES (?, 0, NULL)", (u,))
+            conn.execute("UPDATE scores SET score = score + ?, last_submit = ? WHERE user_id = ?", (100, ts, u))
+            conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'scoreboard_version'")
+    materialized = (time.perf_counter() - started) / (len(solves) - half)
+
+    # bring scores in line with all flags before reading
+    with conn:
+        conn.execute('DELETE FROM scores')
+        conn.execute('''INSERT INTO scores (user_id, score, last_submit)
+            select user_id, sum(score), max(timestamp) from flags group by user_id''')
+
+    old = timed(lambda: conn.execute(OLD_QUERY).fetchall(), args.reads)
+    new = timed(lambda: conn.execute(scores.SCOREBOARD_QUERY).fetchall(), args.reads)
+    cached = timed(lambda: conn.execute(VERSION_QUERY).fetchone(), args.reads)
+
+    # the two queries have different columns, compare the scores by name
+    def score_column(query):
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        return [r['score'] for r in cursor.execute(query)]
+
+    assert score_column(OLD_QUERY) == score_column(scores.SCOREBOARD_QUERY)
+
+    print('%d users x %d tasks, %d flags' % (args.users, args.tasks, len(solves)))
+    print('submit, flags insert only:          %8.3f ms' % (plain * 1000))
+    print('submit, insert + scores update:     %8.3f ms' % (materialized * 1000))
+    print('scoreboard, aggregate over flags:   %8.3f ms' % (old * 1000))
+    print('scoreboard, scores table:           %8.3f ms' % (new * 1000))
+    print('scoreboard, cached (version check): %8.3f ms' % (cached * 1000))
+
+    conn.close()
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
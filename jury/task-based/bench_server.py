@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""bench_server.py -- concurrency benchmark of /submit and /scoreboard.json
+
+Registers --clients throwaway users on a running server (the contest must
+have started, or the database must be empty), then every client keeps a
+keep-alive connection and mixes flag submissions with scoreboard polls:
+
+    python bench_server.py --url http://127.0.0.1:8081 --clients 50 \\
+        --seconds 20 --flag 1:SCTF{known_flag} --task 1 --task 2
+
+Correct flags given with --flag are submitted once per user, everything
+else is a wrong guess for one of the --task ids.
+"""
+
+import argparse
+import base64
+import http.client
+import random
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+
+class Client(object):
+    def __init__(self, url):
+        self.url = url
+        self.cookie = None
+        self.conn = self._connect()
+
+    def _connect(self):
+        return http.client.HTTPConnection(self.url.hostname, self.url.port or 80, timeout=30)
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            response = self.conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = self._connect()
+            raise
+
+        cookie = response.getheader('Set-Cookie')
+        if cookie:
+            self.cookie = cookie.split(';', 1)[0]
+        return response.status
+
+    def register(self, name):
+        body = urlencode(dict(user=name, email=name + '@bench', affilation='bench',
+            lineup='bench', password='bench'))
+        self.request('POST', '/register/submit', body,
+            {'Content-Type': 'application/x-www-form-urlencoded'})
+
+
+def worker(client, args, flags, deadline, stats, lock):
+    local = {'submit': [], 'scoreboard': [], 'errors': 0, 'statuses': {}}
+    pending = list(flags)
+
+    while time.monotonic() < deadline:
+        if random.random() < args.scoreboard_share:
+            kind, path = 'scoreboard', '/scoreboard.json'
+        else:
+            if pending:
+                tid, flag = pending.pop()
+            else:
+                tid, flag = random.choice(args.task), 'SCTF{%x}' % random.getrandbits(64)
+            kind = 'submit'
+            path = '/submit/%s/%s' % (tid, base64.b64encode(flag.encode()).decode())
+
+        started = time.perf_counter()
+        try:
+            status = client.request('GET', path)
+        except (OSError, http.client.HTTPException):
+            local['errors'] += 1
+            continue
+        local[kind].append(time.perf_counter() - started)
+        local['statuses'][status] = local['statuses'].get(status, 0) + 1
+
+    with lock:
+        for key in ('submit', 'scoreboard'):
+            stats[key].extend(local[key])
+        stats['errors'] += local['errors']
+        for status, count in local['statuses'].items():
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + count
+
+
+def report(name, latencies, seconds):
+    if not latencies:
+        print('%-10s no requests' % name)
+        return
+    latencies.sort()
+    pct = lambda p: latencies[max(0, int(len(latencies) * p / 100) - 1)] * 1000
+    print('%-10s %7d req %8.0f rps  p50 %7.2f ms  p90 %7.2f ms  p99 %7.2f ms' % (
+        name, len(latencies), len(latencies) / seconds, pct(50), pct(90), pct(99)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8081')
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--seconds', type=float, default=20)
+    parser.add_argument('--scoreboard-share', type=float, default=0.3)
+    parser.add_argument('--task', action='append', default=[])
+    parser.add_argument('--flag', action='append', default=[],
+        help='TID:FLAG of a correct flag')
+    args = parser.parse_args()
+
+    url = urlparse(args.url)
+    flags = [tuple(f.split(':', 1)) for f in args.flag]
+    if not args.task:
+        args.task = [tid for tid, flag in flags] or ['1']
+
+    prefix = 'bench%x' % random.getrandbits(24)
+    clients = []
+    for i in range(args.clients):
+        client = Client(url)
+        client.register('%s_%d' % (prefix, i))
+        clients.append(client)
+
+    stats = {'submit': [], 'scoreboard': [], 'errors': 0, 'statuses': {}}
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.seconds
+    threads = [threading.Thread(target=worker, args=(c, args, flags, deadline, stats, lock))
+        for c in clients]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print('%d clients, %.0f s' % (args.clients, args.seconds))
+    report('submit', stats['submit'], args.seconds)
+    report('scoreboard', stats['scoreboard'], args.seconds)
+    print('statuses: %r, errors: %d' % (stats['statuses'], stats['errors']))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,3 +4,11 @@ sqlite3 ctf.db 'CREATE TABLE categories ( id INTEGER PRIMARY KEY, name TEXT );'
 sqlite3 ctf.db 'CREATE TABLE tasks (id INTEGER PRIMARY KEY, name TEXT, desc TEXT, hint TEXT, solve TEXT, author TEXT, file TEXT, flag TEXT, score INT, category INT, FOREIGN KEY(category) REFERENCES categories(id) ON DELETE CASCADE);'
 sqlite3 ctf.db 'CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT NOT NULL, email TEXT, isAdmin BOOLEAN, isHidden BOOLEAN, affilation TEXT, lineup TEXT, password TEXT, "logo"  TEXT NOT NULL DEFAULT "teams/404.png")';
 sqlite3 ctf.db 'CREATE TABLE flags (task_id INTEGER, user_id INTEGER, score INTEGER, timestamp BIGINT, ip TEXT, PRIMARY KEY (task_id, user_id), FOREIGN KEY(task_id) REFERENCES tasks(id) ON DELETE CASCADE, FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE);'
+sqlite3 ctf.db 'CREATE TABLE scores (user_id INTEGER PRIMARY KEY, score INTEGER NOT NULL DEFAULT 0, last_submit BIGINT, FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE);'
+sqlite3 ctf.db 'CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER);'
+sqlite3 ctf.db "INSERT INTO meta (key, value) VALUES ('scoreboard_version', 0);"
+sqlite3 ctf.db 'CREATE INDEX flags_user_id ON flags (user_id);'
+sqlite3 ctf.db 'CREATE INDEX tasks_category ON tasks (category);'
+sqlite3 ctf.db 'CREATE INDEX users_email ON users (email);'
+sqlite3 ctf.db 'CREATE INDEX users_username ON users (username);'
+sqlite3 ctf.db 'PRAGMA journal_mode=WAL;'
@@ -0,0 +1,155 @@
+"""cache.py -- small in-process caches used by the flask server"""
+
+import threading
+import time
+
+_MISSING = object()
+
+
+class TTLCache(object):
+    """Thread-safe key/value cache whose entries expire after `ttl` seconds.
+
+    Entries are also dropped explicitly with `invalidate` whenever this
+    process writes the underlying rows, so the TTL only bounds how long a
+    change made by another server process can go unnoticed.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, loader):
+        """Returns the cached value for key, calling loader() on a miss"""
+
+        now = time.monotonic()
+        entry = self._data.get(key, _MISSING)
+        if entry is not _MISSING and entry[1] > now:
+            return entry[0]
+
+        value = loader()
+        with self._lock:
+            self._data[key] = (value, now + self.ttl)
+        return value
+
+    def invalidate(self, key=_MISSING):
+        """Drops one key, or everything when called without arguments"""
+
+        with self._lock:
+            if key is _MISSING:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+
+class TaskGrid(object):
+    """In-memory model of the /tasks grid.
+
+    Holds categories, tasks, per-task solve counts and per-user solved sets.
+    Solves are applied incrementally by `add_solve`; admin edits call
+    `invalidate`. The whole model is also reloaded every `ttl` seconds so
+    that solves accepted by other server processes show up.
+    """
+
+    def __init__(self, db, ttl):
+        self.db = db
+        self.ttl = ttl
+        self.categories = []
+        self.tasks = {}
+        self.solves = {}
+        self.solved = {}
+        self._expires = 0
+        self._lock = threading.RLock()
+
+    def _load(self):
+        categories = [dict(c) for c in self.db.query(
+            "SELECT id, name FROM categories ORDER BY id")]
+
+        tasks = {}
+        for t in self.db.query(
+                "SELECT id, name, score, category FROM tasks ORDER BY category, score"):
+            tasks.setdefault(t['category'], []).append(dict(t))
+
+        solves = {}
+        for r in self.db.query(
+                "SELECT task_id, count(*) count FROM flags GROUP BY task_id"):
+            solves[r['task_id']] = r['count']
+
+        self.categories = categories
+        self.tasks = tasks
+        self.solves = solves
+        self.solved = {}
+        self._expires = time.monotonic() + self.ttl
+
+    def _ensure(self):
+        if time.monotonic() >= self._expires:
+            with self._lock:
+                if time.monotonic() >= self._expires:
+                    self._load()
+
+    def invalidate(self):
+        """Forces a reload on the next access (call after admin edits)"""
+
+        self._expires = 0
+
+    def solved_by(self, user_id):
+        """Returns the set of task ids solved by the user"""
+
+        self._ensure()
+        solved = self.solved.get(user_id)
+        if solved is None:
+            # loaded under the lock: an add_solve for this user either ran
+            # before the query (which then sees its flag) or waits and
+            # updates the stored set
+            with self._lock:
+                solved = self.solved.get(user_id)
+                if solved is None:
+                    solved = set(r['task_id'] for r in self.db.query(
+                        "SELECT task_id FROM flags WHERE user_id = :user_id",
+                        user_id=user_id))
+                    self.solved[user_id] = solved
+        return solved
+
+    def solve_count(self, task_id):
+        self._ensure()
+        return self.solves.get(task_id, 0)
+
+    def add_solve(self, task_id, user_id):
+        """Applies a freshly inserted flag to the model"""
+
+        with self._lock:
+            self.solves[task_id] = self.solves.get(task_id, 0) + 1
+            if user_id in self.solved:
+                self.solved[user_id].add(task_id)
+
+    def grid(self, user_id, user_count, is_admin):
+        """Builds the rows rendered by tasks.html for one user"""
+
+        self._ensure()
+        solved = self.solved_by(user_id)
+        grid = []
+
+        for cat in self.categories:
+            row = [cat]
+            for task in self.tasks.get(cat['id'], []):
+                tid = task['id']
+                if user_count:
+                    percentComplete = (float(self.solves.get(tid, 0)) / user_count) * 100
+                else:
+                    percentComplete = 0
+
+                #hax for bad css (if 100, nothing will show)
+                if percentComplete >= 100:
+                    percentComplete = 99.99
+
+                task = dict(task)
+                task['percentComplete'] = percentComplete
+                task['isComplete'] = tid in solved
+                row.append(task)
+
+            if is_admin:
+                row.append({'add': True, 'category': cat['id']})
+
+            grid.append(row)
+
+        return grid
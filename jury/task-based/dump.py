@@ -0,0 +1,180 @@
+"""dump.py -- background snapshot and export for /makedump
+
+A dump is taken in a worker thread, never in the request thread:
+
+  1. the SQLite backup API copies the live database page by page into
+     <dir>/snapshot-<stamp>.db, which gives a consistent point-in-time
+     copy without blocking writers for longer than one step;
+  2. users, flags, tasks and categories are read from the snapshot with a
+     plain cursor (fetchmany, nothing is loaded whole) and written as
+     gzipped NDJSON, one {"table": ..., "row": {...}} object per line.
+
+Under gevent workers the "thread" is a greenlet, so the job yields
+(time.sleep(0)) after every backup step and export batch to let the
+worker's requests through.
+
+Progress goes to <dir>/status.json, so every server process (gunicorn
+workers share nothing) reports the same state.
+"""
+
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import time
+
+TABLES = ('categories', 'tasks', 'users', 'flags')
+BACKUP_PAGES = 256
+FETCH_SIZE = 500
+
+
+class Dumper(object):
+    def __init__(self, db_url, directory, keep=5):
+        if not db_url.startswith('sqlite:///'):
+            raise ValueError('dumps need an sqlite database, got %s' % db_url)
+        self.db_path = db_url[len('sqlite:///'):]
+        self.directory = directory
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._thread = None
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @property
+    def status_path(self):
+        return os.path.join(self.directory, 'status.json')
+
+    def status(self):
+        try:
+            with open(self.status_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'state': 'idle'}
+
+    def _progress(self, status):
+        """Writes status at most every half second"""
+
+        now = time.time()
+        if now - status['updated'] >= 0.5:
+            status['updated'] = now
+            self._write_status(status)
+
+    def _write_status(self, status):
+        tmp = self.status_path + '.%d' % os.getpid()
+        with open(tmp, 'w') as f:
+            json.dump(status, f)
+        os.rename(tmp, self.status_path)
+
+    def start(self):
+        """Starts a dump unless one is running; returns the current status"""
+
+        with self._lock:
+            status = self.status()
+            if status['state'] == 'running' and \
+                    time.time() - status.get('updated', 0) < 60:
+                return status
+
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            status = {
+                'state': 'running',
+                'phase': 'backup',
+                'started': time.time(),
+                'updated': time.time(),
+                'snapshot': 'snapshot-%s.db' % stamp,
+                'file': 'dump-%s.ndjson.gz' % stamp,
+                'tables': {},
+                'progress': 0.0
+            }
+            self._write_status(status)
+            self._thread = threading.Thread(target=self._run, args=(status,),
+                name='makedump', daemon=True)
+            self._thread.start()
+            return status
+
+    def _run(self, status):
+        try:
+            snapshot = os.path.join(self.directory, status['snapshot'])
+            self._backup(snapshot, status)
+            self._export(snapshot, os.path.join(self.directory, status['file']), status)
+            status['state'] = 'done'
+            status['progress'] = 1.0
+            self._cleanup()
+        except Exception as e:
+            status['state'] = 'failed'
+            status['error'] = repr(e)
+        status['updated'] = status['finished'] = time.time()
+        self._write_status(status)
+
+    def _backup(self, snapshot, status):
+        def progress(remaining_status, remaining, total):
+            # the backup is the first half of the job
+            status['progress'] = 0.5 * (total - remaining) / max(total, 1)
+            self._progress(status)
+            time.sleep(0)
+
+        source = sqlite3.connect(self.db_path)
+        target = sqlite3.connect(snapshot)
+        try:
+            source.backup(target, pages=BACKUP_PAGES, progress=progress, sleep=0.005)
+            # a self-contained file, no -wal/-shm next to it
+            target.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            target.close()
+            source.close()
+
+    def _export(self, snapshot, path, status):
+        status['phase'] = 'export'
+        self._write_status(status)
+        conn = sqlite3.connect('file:%s?mode=ro' % snapshot, uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            existing = set(r[0] for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"))
+            tables = [t for t in TABLES if t in existing]
+            totals = dict((t, conn.execute('SELECT count(*) FROM %s' % t).fetchone()[0])
+                for t in tables)
+            total = max(sum(totals.values()), 1)
+            written = 0
+
+            tmp = path + '.part'
+            with gzip.open(tmp, 'wt', encoding='utf-8') as out:
+                for table in tables:
+                    status['tables'][table] = {'rows': 0, 'total': totals[table]}
+                    cursor = conn.execute('SELECT * FROM %s ORDER BY rowid' % table)
+                    while True:
+                        rows = cursor.fetchmany(FETCH_SIZE)
+                        if not rows:
+                            break
+                        for row in rows:
+                            out.write(json.dumps({'table': table, 'row': dict(row)},
+                                ensure_ascii=False))
+                            out.write('\n')
+                        written += len(rows)
+                        status['tables'][table]['rows'] += len(rows)
+                        status['progress'] = 0.5 + 0.5 * written / total
+                        self._progress(status)
+                        time.sleep(0)
+            os.rename(tmp, path)
+        finally:
+            conn.close()
+
+    def _cleanup(self):
+        """Keeps only the latest `keep` dumps and snapshots"""
+
+        for prefix in ('dump-', 'snapshot-'):
+            names = sorted(n for n in os.listdir(self.directory)
+                if n.startswith(prefix) and not n.endswith('.part'))
+            for name in names[:-self.keep]:
+                os.remove(os.path.join(self.directory, name))
+
+    def path(self, name):
+        """Absolute path of a finished dump file, None if there is none"""
+
+        if os.path.basename(name) != name or not name.startswith(('dump-', 'snapshot-')):
+            return None
+        path = os.path.abspath(os.path.join(self.directory, name))
+        if name.endswith('.part') or not os.path.isfile(path):
+            return None
+        return path
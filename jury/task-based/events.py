@@ -0,0 +1,134 @@
+"""events.py -- solve events for the /events stream
+
+Every server process keeps one poller thread that reads new rows of the
+flags table by rowid, so solves recorded by any gunicorn worker reach the
+subscribers of every worker. submit wakes the local poller right after
+its insert, the other processes see the solve within `interval` seconds.
+
+The last `backlog` events are kept in memory; subscribers wait on a
+condition instead of holding a queue each, and reconnecting clients
+resume from their Last-Event-ID.
+
+Under serve.py's default gevent workers a waiting stream costs a
+greenlet, and `max_clients` is half of the worker's connections (at most
+eventsMaxClients). Under gthread a stream holds a thread, so the limit is
+half of the threads. Further clients get a 503 and retry later.
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+
+EVENTS_QUERY = '''SELECT f.rowid AS id, f.task_id, f.user_id, f.score,
+    f.timestamp, t.name AS task, c.name AS category, u.username AS user,
+    NOT EXISTS (SELECT 1 FROM flags p JOIN users pu ON pu.id = p.user_id
+        WHERE p.task_id = f.task_id AND p.rowid < f.rowid
+        AND pu.isHidden = 0) AS first_blood
+    FROM flags f
+    JOIN tasks t ON t.id = f.task_id
+    JOIN categories c ON c.id = t.category
+    JOIN users u ON u.id = f.user_id
+    WHERE f.rowid > :last AND u.isHidden = 0
+    ORDER BY f.rowid LIMIT 500'''
+
+
+class SolveEvents(object):
+    def __init__(self, db, interval=1, backlog=256, heartbeat=15, max_clients=1000):
+        self.db = db
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self.max_clients = max_clients
+        self.clients = 0
+        self._events = collections.deque(maxlen=backlog)
+        self._head = 0
+        self._last = None
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def _ensure(self):
+        # Threads do not survive gunicorn's fork, start one per process
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    row = self.db.query('SELECT max(rowid) AS last FROM flags').next()
+                    self._head = row['last'] or 0
+                    self._last = max(0, self._head - self._events.maxlen)
+                    self._pid = os.getpid()
+                    self._thread = threading.Thread(target=self._run,
+                        name='solve-events', daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                self.poll()
+            except Exception:
+                # database busy or restarting; try again on the next tick
+                pass
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def poll(self):
+        """Reads new solves and wakes up the subscribers"""
+
+        while True:
+            rows = list(self.db.query(EVENTS_QUERY, last=self._last))
+            if not rows:
+                return
+            with self._cond:
+                for r in rows:
+                    event = dict(r)
+                    event['first_blood'] = bool(event['first_blood'])
+                    self._events.append(event)
+                self._last = rows[-1]['id']
+                self._cond.notify_all()
+
+    def wake(self):
+        """Called by submit after a flag insert"""
+
+        self._ensure()
+        self._wake.set()
+
+    def since(self, last_id, timeout):
+        """Events newer than last_id, waiting up to timeout for the first"""
+
+        self._ensure()
+        with self._cond:
+            events = [e for e in self._events if e['id'] > last_id]
+            if not events:
+                self._cond.wait(timeout)
+                events = [e for e in self._events if e['id'] > last_id]
+        return events
+
+    def stream(self, last_id=None):
+        """Generator of server-sent events"""
+
+        self._ensure()
+        if last_id is None:
+            # new clients start from now, the backlog is for reconnects
+            with self._cond:
+                last_id = max(self._head, self._last)
+
+        with self._lock:
+            self.clients += 1
+        try:
+            yield 'retry: 3000\n\n'
+            deadline = time.monotonic() + self.heartbeat
+            while True:
+                events = self.since(last_id, max(0, deadline - time.monotonic()))
+                if not events:
+                    yield ': ping\n\n'
+                    deadline = time.monotonic() + self.heartbeat
+                    continue
+                for event in events:
+                    yield 'id: %d\nevent: solve\ndata: %s\n\n' % (
+                        event['id'], json.dumps(event, ensure_ascii=False))
+                last_id = events[-1]['id']
+        finally:
+            with self._lock:
+                self.clients -= 1
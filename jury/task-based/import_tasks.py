@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""import_tasks.py -- bulk import of tasks/<category>/<name>/main.json
+
+Walks the task tree (the same layout tasks/makeREADME.py checks), upserts
+categories and tasks in a single transaction and copies attachments into
+static/files/ under their content hash (see attachments.py). Tasks are
+matched by category and name, so running it again only writes what has
+changed in the tree:
+
+    python import_tasks.py ../../tasks --lang RU
+    python import_tasks.py ../../tasks --dry-run
+
+Tasks that exist only in the database are left alone. Running servers pick
+the changes up once their task grid and flag map expire (taskGridTTL).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import bleach
+
+import attachments
+import storage
+
+descAllowedTags = bleach.ALLOWED_TAGS + ['br', 'pre']
+
+FIELDS = ('desc', 'hint', 'solve', 'author', 'file', 'flag', 'score')
+
+
+def find_tasks(root):
+    """Yields the directories holding a main.json, sorted"""
+
+    for category in sorted(os.listdir(root)):
+        path = os.path.join(root, category)
+        if not os.path.isdir(path):
+            continue
+        for name in sorted(os.listdir(path)):
+            task_dir = os.path.join(path, name)
+            if os.path.isfile(os.path.join(task_dir, 'main.json')):
+                yield task_dir
+
+
+def localized(value, lang):
+    if isinstance(value, dict):
+        return value.get(lang) or value.get('RU') or value.get('EN') or ''
+    return value or ''
+
+
+def parse_task(task_dir, lang):
+    """Turns main.json into a row of the tasks table plus its category"""
+
+    with open(os.path.join(task_dir, 'main.json'), encoding='utf-8') as f:
+        data = json.load(f)
+
+    hints = [localized(h, lang) for h in data.get('hints', [])]
+    authors = []
+    for author in data.get('authors', []):
+        authors.append('[%s] %s' % (author.get('team', ''), author.get('name', '')))
+
+    files = [os.path.join(task_dir, f['location']) for f in data.get('files', [])]
+
+    task = dict(
+        name=bleach.clean(data['name'], tags=[]),
+        desc=bleach.clean(localized(data.get('description'), lang), tags=descAllowedTags),
+        hint=bleach.clean('<br>'.join(h for h in hints if h), tags=descAllowedTags),
+        solve=bleach.clean(localized(data.get('solve'), lang), tags=descAllowedTags),
+        author=bleach.clean(', '.join(authors), tags=[]),
+        flag=data['flag_key'],
+        score=int(data['value']))
+
+    return data['category'], task, files
+
+
+def import_tasks(db, root, lang, dry_run=False):
+    """Upserts every task under root; returns counters of what was done"""
+
+    stats = {'categories': 0, 'added': 0, 'updated': 0, 'unchanged': 0,
+        'files': 0, 'errors': 0}
+
+    parsed = []
+    for task_dir in find_tasks(root):
+        try:
+            category, task, files = parse_task(task_dir, lang)
+        except (ValueError, KeyError, OSError) as e:
+            print('skip %s: %r' % (task_dir, e))
+            stats['errors'] += 1
+            continue
+
+        # The tasks table holds a single attachment per task
+        task['file'] = None
+        if len(files) > 1:
+            print('%s: %d files, only the first one is imported' % (task_dir, len(files)))
+        if files:
+            if not os.path.isfile(files[0]):
+                print('%s: missing attachment %s' % (task_dir, files[0]))
+            elif dry_run:
+                task['file'] = attachments.hashed_name(files[0])
+            else:
+                task['file'] = attachments.store_path(files[0])
+                stats['files'] += 1
+
+        parsed.append((category, task))
+
+    with db as tx:
+        categories = dict((c['name'], c['id']) for c in tx['categories'].all())
+        existing = {}
+        for t in tx['tasks'].all():
+            existing[(t['category'], t['name'])] = t
+
+        for category, task in parsed:
+            if category not in categories:
+                stats['categories'] += 1
+                categories[category] = None if dry_run else \
+                    tx['categories'].insert(dict(name=category))
+            task['category'] = categories[category]
+
+            current = existing.get((task['category'], task['name']))
+            if current is None:
+                stats['added'] += 1
+                print('add    %s/%s' % (category, task['name']))
+                if not dry_run:
+                    tx['tasks'].insert(task)
+                continue
+
+            if task['file'] is None:
+                task['file'] = current['file']
+            changed = [f for f in FIELDS if current[f] != task[f]]
+            if not changed:
+                stats['unchanged'] += 1
+                continue
+
+            stats['updated'] += 1
+            print('update %s/%s (%s)' % (category, task['name'], ', '.join(changed)))
+            if not dry_run:
+                task['id'] = current['id']
+                tx['tasks'].update(task, ['id'])
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import tasks from main.json files')
+    parser.add_argument('root', nargs='?', default=os.path.join('..', '..', 'tasks'))
+    parser.add_argument('--lang', choices=['RU', 'EN'])
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    with open('config.json', 'r') as f:
+        config = json.load(f)
+
+    lang = args.lang or ('RU' if config['language'] == 'russian' else 'EN')
+
+    started = time.time()
+    db = storage.connect(config['db'], config.get('sqlite'))
+    stats = import_tasks(db, args.root, lang, args.dry_run)
+
+    print('%(categories)d new categories, %(added)d added, %(updated)d updated, '
+        '%(unchanged)d unchanged, %(files)d files, %(errors)d errors' % stats)
+    print('%.2f s%s' % (time.time() - started, ' (dry run)' if args.dry_run else ''))
+    if stats['errors']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
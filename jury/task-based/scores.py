@@ -0,0 +1,93 @@
+"""scores.py -- materialized scoreboard for the flask server
+
+Per-user totals live in the `scores` table and are updated in the same
+transaction as the `flags` insert, together with a scoreboard version
+number in `meta`. Readers only check the version (a primary key lookup)
+and reuse the already built rows and JSON while it is unchanged.
+"""
+
+import json
+import threading
+
+SCHEMA = [
+    '''CREATE TABLE IF NOT EXISTS scores (user_id INTEGER PRIMARY KEY,
+        score INTEGER NOT NULL DEFAULT 0, last_submit BIGINT,
+        FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE)''',
+    '''CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)''',
+    '''INSERT OR IGNORE INTO meta (key, value) VALUES ('scoreboard_version', 0)''',
+]
+
+SCOREBOARD_QUERY = '''select u.id as user_id, u.username, u.affilation, u.logo,
+    ifnull(s.score, 0) as score, s.last_submit from users u
+    left join scores s on s.user_id = u.id where u.isHidden = 0
+    order by score desc, last_submit asc'''
+
+def ensure_schema(db):
+    """Creates the scores tables and fills them from flags if they are new"""
+
+    fresh = 'scores' not in db.tables
+    for statement in SCHEMA:
+        db.query(statement)
+    if fresh:
+        rebuild(db)
+
+def rebuild(db):
+    """Recomputes every user's total from the flags table"""
+
+    with db as tx:
+        tx.query('DELETE FROM scores')
+        tx.query('''INSERT INTO scores (user_id, score, last_submit)
+            select user_id, sum(score), max(timestamp) from flags group by user_id''')
+        bump_version(tx)
+
+def record_solve(tx, user_id, score, timestamp):
+    """Adds a solve to the user's total; call inside the flags transaction"""
+
+    tx.query('''INSERT OR IGNORE INTO scores (user_id, score, last_submit)
+        VALUES (:user_id, 0, NULL)''', user_id=user_id)
+    tx.query('''UPDATE scores SET score = score + :score, last_submit = :timestamp
+        WHERE user_id = :user_id''', user_id=user_id, score=score, timestamp=timestamp)
+    bump_version(tx)
+
+def bump_version(tx):
+    tx.query("UPDATE meta SET value = value + 1 WHERE key = 'scoreboard_version'")
+
+def get_version(db):
+    row = db.query("SELECT value FROM meta WHERE key = 'scoreboard_version'").next()
+    return row['value']
+
+
+class Scoreboard(object):
+    """Caches the scoreboard rows and their JSON per scoreboard version"""
+
+    def __init__(self, db):
+        self.db = db
+        self._version = None
+        self._rows = []
+        self._json = None
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        version = get_version(self.db)
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    rows = [dict(r) for r in self.db.query(SCOREBOARD_QUERY)]
+                    public = [dict(username=r['username'], score=r['score'],
+                        last_submit=r['last_submit']) for r in rows]
+                    self._rows = rows
+                    self._json = json.dumps(public)
+                    self._version = version
+        return self._version
+
+    def rows(self):
+        """Rows for scoreboard.html"""
+
+        self._refresh()
+        return self._rows
+
+    def json(self):
+        """Returns (version, serialized JSON) for /scoreboard.json"""
+
+        version = self._refresh()
+        return version, self._json
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""serve.py -- production entry point for the flask server
+
+Runs server.app under gunicorn: pre-forked worker processes, HTTP
+keep-alive and graceful reload on SIGHUP. Settings come from the "server"
+block of config.json and can be overridden on the command line:
+
+    python serve.py --workers 8 --worker-connections 2000
+
+Workers are gevent workers by default (pip install gunicorn gevent): a
+request is a greenlet, so an open /events stream costs a greenlet and a
+socket, not a thread. Each worker takes `worker_connections` clients and
+lets at most half of them be streams (and no more than eventsMaxClients),
+the rest stay for pages and submits. With config.json as shipped, that is
+4 workers x 1000 = 4000 streams. SQLite calls do not yield, they block
+their worker for as long as they take; the queries here are short.
+
+    python serve.py --worker-class gthread --threads 8
+
+runs a thread pool per worker instead; there a stream holds a thread and
+only half of the threads may stream (4 workers x 4 = 16 streams).
+
+It listens on 127.0.0.1 behind nginx (nginx.conf), which sends the
+attachments and passes the client address in X-Forwarded-For.
+
+The app is not preloaded: every worker imports server.py itself, so on
+SIGHUP the new workers run the current code and config.json.
+
+Workers share nothing but the database: caches and rate limits live in
+each process and follow the database on their own. The submit rate
+limits are therefore counted per worker; with N workers a client
+spreading requests over them gets up to N times the configured rates.
+"""
+
+import argparse
+import json
+import multiprocessing
+
+DEFAULTS = {
+    "workers": multiprocessing.cpu_count() * 2 + 1,
+    "threads": 4,
+    "keepalive": 5,
+    "timeout": 30,
+    "graceful_timeout": 30,
+    "backlog": 2048,
+    "max_requests": 0,
+    "worker_class": "gevent",
+    "worker_connections": 1000
+}
+
+
+def options(config, args):
+    settings = dict(DEFAULTS)
+    settings.update(config.get('server', {}))
+    for key in ('workers', 'threads', 'worker_connections', 'keepalive', 'worker_class'):
+        value = getattr(args, key)
+        if value is not None:
+            settings[key] = value
+
+    settings['bind'] = '%s:%d' % (config['host'], config['port'])
+    settings['proc_name'] = 'ctf-task-based'
+    return settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Production server for the task-based jury')
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--threads', type=int)
+    parser.add_argument('--worker-connections', dest='worker_connections', type=int)
+    parser.add_argument('--keepalive', type=int)
+    parser.add_argument('--worker-class', dest='worker_class')
+    args = parser.parse_args()
+
+    with open('config.json', 'r') as f:
+        config = json.load(f)
+
+    from gunicorn.app.base import BaseApplication
+
+    class Application(BaseApplication):
+        def __init__(self, settings):
+            self.settings = settings
+            BaseApplication.__init__(self)
+
+        def load_config(self):
+            for key, value in self.settings.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            import server
+            # an open /events stream holds a connection (gevent) or a
+            # thread (gthread) of the worker: keep half for pages and submits
+            if self.settings.get('worker_class') == 'gthread':
+                limit = max(1, int(self.settings['threads']) // 2)
+            else:
+                limit = max(1, int(self.settings['worker_connections']) // 2)
+            server.solve_events.max_clients = min(
+                server.solve_events.max_clients, limit)
+            return server.app
+
+    Application(options(config, args)).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -16,26 +16,43 @@ import codecs
 from base64 import b64decode
 from functools import wraps
 
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
-from sqlite3 import Connection as SQLite3Connection
 from werkzeug.contrib.fixers import ProxyFix
 
 from flask import Flask
+from flask import g
 from flask import jsonify
 from flask import make_response
 from flask import redirect
 from flask import render_template
+from flask import send_file
 from flask import request
 from flask import session
 from flask import url_for
 from flask import Response
 
+from sqlalchemy.exc import IntegrityError
+
+from cache import TTLCache
+from cache import TaskGrid
+
+import attachments
+import dump
+from events import SolveEvents
+import scores
+import storage
+from submission import Submissions
+
 app = Flask(__name__, static_folder='static', static_url_path='')
 
 db = None
 lang = None
 config = None
+user_cache = None
+task_grid = None
+scoreboard_cache = None
+submissions = None
+dumper = None
+solve_events = None
 
 descAllowedTags = bleach.ALLOWED_TAGS + ['br', 'pre']
 
@@ -43,7 +60,7 @@ def start_required(f):
     """Ensures that an tournament is logged in"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        userCount = db['users'].count()
+        userCount = get_user_count()
         user = get_user()
         if user["isAdmin"] == False and (datetime.datetime.today() < config['startTime'] and userCount != 0):
             return redirect('/error/not_started')
@@ -74,13 +91,38 @@ def admin_required(f):
     return decorated_function
 
 def get_user():
-    """Looks up the current user in the database"""
+    """Looks up the current user, at most once per request"""
+
+    if 'user_id' not in session:
+        return None
+
+    user_id = session['user_id']
+    if getattr(g, 'user_id', None) != user_id:
+        user = user_cache.get(('user', user_id),
+            lambda: db['users'].find_one(id=user_id))
+        g.user = dict(user) if user else None
+        g.user_id = user_id
+
+    return g.user
+
+def get_user_count(visible=False):
+    """Returns the number of (visible) users"""
+
+    if visible:
+        return user_cache.get(('count', True),
+            lambda: db['users'].count(isHidden=0))
+    return user_cache.get(('count', False), lambda: db['users'].count())
 
-    login = 'user_id' in session
-    if login:
-        return db['users'].find_one(id=session['user_id'])
+def invalidate_users(user_id=None):
+    """Drops cached user rows and counts after a write to the users table"""
 
-    return None
+    if user_id is None:
+        user_cache.invalidate()
+    else:
+        user_cache.invalidate(('user', user_id))
+        user_cache.invalidate(('count', True))
+        user_cache.invalidate(('count', False))
+    g.pop('user_id', None)
 
 def get_task(tid):
     """Finds a task with a given category and score"""
@@ -91,23 +133,15 @@ def get_task(tid):
     return task.next()
 
 def get_flags():
-    """Returns the flags of the current user"""
-
-    flags = db.query('''select f.task_id from flags f
-        where f.user_id = :user_id''',
-        user_id=session['user_id'])
-    return [f['task_id'] for f in list(flags)]
+    """Returns the ids of the tasks solved by the current user"""
 
-def get_total_completion_count():
-    """Returns dictionary where key is task id and value is the number of users who have submitted the flag"""
+    return task_grid.solved_by(session['user_id'])
 
-    c = db.query("select t.id, count(t.id) count from tasks t join flags f on t.id = f.task_id group by t.id;")
+@app.teardown_request
+def release_db(exc):
+    """Closes the request thread's database connection, see storage.py"""
 
-    res = {}
-    for r in c:
-        res.update({r['id']: r['count']})
-
-    return res
+    storage.release(db)
 
 @app.route('/error/<msg>')
 def error(msg):
@@ -129,14 +163,6 @@ def session_login(email):
     user = db['users'].find_one(email=email)
     session['user_id'] = user['id']
 
-@event.listens_for(Engine, "connect")
-def _set_sqlite_pragma(dbapi_connection, connection_record):
-    """ Enforces sqlite foreign key constrains """
-    if isinstance(dbapi_connection, SQLite3Connection):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON;")
-        cursor.close()
-
 @app.route('/login', methods = ['POST'])
 def login():
     """Attempts to log the user in"""
@@ -161,7 +187,7 @@ def login():
 def register():
     """Displays the register form"""
 
-    userCount = db['users'].count()
+    userCount = get_user_count()
     if datetime.datetime.today() < config['startTime'] and userCount != 0:
         return redirect('/error/not_started')
 
@@ -194,6 +220,8 @@ def register_submit():
 
     isAdmin = False
     isHidden = False
+    # read past the cache: another worker may have registered the first
+    # user a moment ago, and a stale zero would make this one admin too
     userCount = db['users'].count()
 
     #if no users, make first user admin
@@ -206,6 +234,8 @@ def register_submit():
         password=generate_password_hash(password), isAdmin=isAdmin,
         isHidden=isHidden)
     db['users'].insert(new_user)
+    invalidate_users()
+    scores.bump_version(db)
 
     # Set up the user id for this session
     session_login(email)
@@ -218,45 +248,11 @@ def tasks():
     """Displays all the tasks in a grid"""
 
     user = get_user()
-    userCount = db['users'].count(isHidden=0)
+    userCount = get_user_count(visible=True)
     isAdmin = user['isAdmin']
 
-    categories = db['categories']
-    catCount = categories.count()
-
-    flags = get_flags()
-
-    tasks = db.query("SELECT * FROM tasks ORDER BY category, score")
-    tasks = list(tasks)
-    taskCompletedCount = get_total_completion_count()
-
-    grid = []
-
-    for cat in categories:
-        cTasks = [x for x in tasks if x['category'] == cat['id']]
-        gTasks = []
-
-        gTasks.append(cat)
-        for task in cTasks:
-            tid = task['id']
-            if tid in taskCompletedCount:
-                percentComplete = (float(taskCompletedCount[tid]) / userCount) * 100
-            else:
-                percentComplete = 0
-
-            #hax for bad css (if 100, nothing will show)
-            if percentComplete == 100:
-                percentComplete = 99.99
-
-            task['percentComplete'] = percentComplete
-
-            task['isComplete'] = tid in flags
-            gTasks.append(task)
-
-        if isAdmin:
-            gTasks.append({'add': True, 'category': cat['id']})
-
-        grid.append(gTasks)
+    grid = task_grid.grid(user['id'], userCount, isAdmin)
+    categories = task_grid.categories
 
     # Render template
     render = render_template('frame.html', lang=lang, page='tasks.html',
@@ -273,14 +269,28 @@ def addcat():
 @app.route('/makedump', methods=['GET'])
 @admin_required
 def makedump():
-    result = db['users'].all()
-    fh = open('users.json', 'wb')
-    dataset.freeze(result, format='json', fileobj=fh)
+    """Starts a snapshot and export in the background, see dump.py"""
+
+    dumper.start()
     user = get_user()
     render = render_template('frame.html', lang=lang,
         page='main.html', user=user)
     return make_response(render)
 
+@app.route('/makedump/status', methods=['GET'])
+@admin_required
+def makedump_status():
+    return jsonify(dumper.status())
+
+@app.route('/makedump/<name>', methods=['GET'])
+@admin_required
+def makedump_download(name):
+    path = dumper.path(name)
+    if path is None:
+        return make_response('Not found', 404)
+    return send_file(path, as_attachment=True, attachment_filename=name,
+        conditional=True)
+
 @app.route('/addcat/', methods=['POST'])
 @admin_required
 def addcatsubmit():
@@ -291,6 +301,7 @@ def addcatsubmit():
     else:
         categories = db['categories']
         categories.insert(dict(name=name))
+        task_grid.invalidate()
         return redirect('/tasks')
 
 @app.route('/editcat/<id>/', methods=['GET'])
@@ -311,6 +322,7 @@ def editcatsubmit(catId):
     else:
         categories = db['categories']
         categories.update(dict(name=name, id=catId), ['id'])
+        task_grid.invalidate()
         return redirect('/tasks')
 
 @app.route('/editcat/<catId>/delete', methods=['GET'])
@@ -326,6 +338,8 @@ def deletecat(catId):
 @admin_required
 def deletecatsubmit(catId):
     db['categories'].delete(id=catId)
+    task_grid.invalidate()
+    submissions.invalidate()
     return redirect('/tasks')
 
 @app.route('/addtask/<cat>/', methods=['GET'])
@@ -368,16 +382,12 @@ def addtasksubmit(cat):
         file = request.files['file']
 
         if file:
-            filename, ext = os.path.splitext(file.filename)
-            #hash current time for file name
-            filename = hashlib.md5(str(datetime.datetime.utcnow()).encode('utf-8')).hexdigest()
-            #if upload has extension, append to filename
-            if ext:
-                filename = filename + ext
-            file.save(os.path.join("static/files/", filename))
-            task["file"] = filename
+            #content-hashed name, see attachments.py
+            task["file"] = attachments.store(file.stream, file.filename)
 
         tasks.insert(task)
+        task_grid.invalidate()
+        submissions.invalidate()
         return redirect('/tasks')
 
 @app.route('/tasks/<tid>/edit', methods=['GET'])
@@ -427,21 +437,18 @@ def edittasksubmit(tid):
         file = request.files['file']
 
         if file:
-            filename, ext = os.path.splitext(file.filename)
-            #hash current time for file name
-            filename = hashlib.md5(str(datetime.datetime.utcnow()).encode('utf-8')).hexdigest()
-            #if upload has extension, append to filename
-            if ext:
-                filename = filename + ext
-            file.save(os.path.join("static/files/", filename))
-
-            #remove old file
-            if task['file']:
-                os.remove(os.path.join("static/files/", task['file']))
+            filename = attachments.store(file.stream, file.filename)
+
+            #remove old file unless another task shares its content
+            if task['file'] and task['file'] != filename and \
+                    db['tasks'].count(file=task['file']) == 1:
+                attachments.remove(task['file'])
 
             task["file"] = filename
 
         tasks.update(task, ['id'])
+        task_grid.invalidate()
+        submissions.invalidate()
         return redirect('/tasks')
 
 @app.route('/tasks/<tid>/delete', methods=['GET'])
@@ -457,7 +464,14 @@ def deletetask(tid):
 @app.route('/tasks/<tid>/delete', methods=['POST'])
 @admin_required
 def deletetasksubmit(tid):
+    task = db['tasks'].find_one(id=tid)
     db['tasks'].delete(id=tid)
+    if task and task['file'] and not db['tasks'].count(file=task['file']):
+        attachments.remove(task['file'])
+    task_grid.invalidate()
+    submissions.invalidate()
+    # solves of the deleted task are gone with it (ON DELETE CASCADE)
+    scores.rebuild(db)
     return redirect('/tasks')
 
 @app.route('/tasks/<tid>/')
@@ -474,8 +488,7 @@ def task(tid):
     flags = get_flags()
     task_done = task['id'] in flags
 
-    solutions = db['flags'].find(task_id=task['id'])
-    solutions = len(list(solutions))
+    solutions = task_grid.solve_count(task['id'])
 
     # Render template
     render = render_template('frame.html', lang=lang, page='task.html',
@@ -483,34 +496,86 @@ def task(tid):
         user=user, category=task["cat_name"], task=task, score=task["score"])
     return make_response(render)
 
+@app.route('/files/<filename>')
+def attachment(filename):
+    """Serves an attachment with a long-lived cache, see attachments.py"""
+
+    response = attachments.serve(filename,
+        config.get('attachments', {}).get('accelRedirect'))
+    if response is None:
+        return make_response('Not found', 404)
+    return response
+
+def submit_flag(tid, flag):
+    """Checks one flag for the current user and records the solve"""
+
+    try:
+        tid = int(tid)
+    except ValueError:
+        return False
+
+    score = submissions.check(tid, flag)
+    if score is None:
+        return False
+
+    user_id = session['user_id']
+    if submissions.is_solved(tid, user_id):
+        return False
+
+    timestamp = int(time.time() * 1000)
+    ip = request.remote_addr
+
+    # Insert flag and update the materialized score in one transaction
+    new_flag = dict(task_id=tid, user_id=user_id,
+        score=score, timestamp=timestamp, ip=ip)
+    try:
+        with db as tx:
+            tx['flags'].insert(new_flag)
+            scores.record_solve(tx, user_id, score, timestamp)
+    except IntegrityError:
+        # a concurrent request of the same user inserted it first
+        return False
+    task_grid.add_solve(tid, user_id)
+    solve_events.wake()
+
+    return True
+
 @app.route('/submit/<tid>/<flag>')
 @login_required
 def submit(tid, flag):
     """Handles the submission of flags"""
 
-    print(flag)
-    user = get_user()
+    if not submissions.allow(session['user_id'], request.remote_addr):
+        return jsonify({'success': False, 'error': 'rate_limited'}), 429
 
-    task = get_task(tid)
-    flags = get_flags()
-    print(task['flag'])
-    task_done = task['id'] in flags
+    try:
+        flag = b64decode(flag).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        return jsonify({'success': False})
 
-    result = {'success': False}
-    if not task_done and task['flag'] == b64decode(flag).decode("utf-8"):
+    return jsonify({'success': submit_flag(tid, flag)})
 
-        timestamp = int(time.time() * 1000)
-        ip = request.remote_addr
-        print ("flag submitter ip: {}".format(ip))
+@app.route('/submit', methods=['POST'])
+@login_required
+def submit_batch():
+    """Handles several flags at once: {"flags": {"<task id>": "<flag>"}}"""
 
-        # Insert flag
-        new_flag = dict(task_id=task['id'], user_id=session['user_id'],
-            score=task["score"], timestamp=timestamp, ip=ip)
-        db['flags'].insert(new_flag)
+    data = request.get_json(silent=True) or {}
+    flags = data.get('flags')
+    if not isinstance(flags, dict) or not flags:
+        return jsonify({'error': 'bad_request'}), 400
 
-        result['success'] = True
+    if len(flags) > submissions.batch_max:
+        return jsonify({'error': 'too_many_flags'}), 400
 
-    return jsonify(result)
+    if not submissions.allow(session['user_id'], request.remote_addr, len(flags)):
+        return jsonify({'error': 'rate_limited'}), 429
+
+    results = {}
+    for tid, flag in flags.items():
+        results[tid] = isinstance(flag, str) and submit_flag(tid, flag)
+
+    return jsonify({'results': results})
 
 @app.route('/scoreboard')
 @login_required
@@ -518,28 +583,37 @@ def scoreboard():
     """Displays the scoreboard"""
 
     user = get_user()
-    scores = db.query('''select u.username, u.affilation, u.logo, ifnull(sum(f.score), 0) as score,
-        max(timestamp) as last_submit from users u left join flags f
-        on u.id = f.user_id where u.isHidden = 0 group by u.username
-        order by score desc, last_submit asc''')
-
-    scores = list(scores)
 
     # Render template
     render = render_template('frame.html', lang=lang, page='scoreboard.html',
-        user=user, scores=scores)
+        user=user, scores=scoreboard_cache.rows())
     return make_response(render)
 
 @app.route('/scoreboard.json')
 def scoreboard_json():
-    scores = db.query('''select u.username, ifnull(sum(f.score), 0) as score,
-        max(timestamp) as last_submit from users u left join flags f
-        on u.id = f.user_id where u.isHidden = 0 group by u.username
-        order by score desc, last_submit asc''')
+    version, body = scoreboard_cache.json()
+    etag = '"scoreboard-%d"' % version
+
+    if etag in request.headers.get('If-None-Match', ''):
+        return Response(status=304, headers={'ETag': etag})
 
-    scores = list(scores)
+    return Response(body, mimetype='application/json', headers={'ETag': etag})
+
+@app.route('/events')
+def events():
+    """Server-sent stream of solves, see events.py"""
+
+    if solve_events.clients >= solve_events.max_clients:
+        return Response(status=503, headers={'Retry-After': '10'})
+
+    last_id = request.headers.get('Last-Event-ID')
+    try:
+        last_id = int(last_id) if last_id else None
+    except ValueError:
+        last_id = None
 
-    return Response(json.dumps(scores), mimetype='application/json')
+    return Response(solve_events.stream(last_id), mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/about')
 @login_required
@@ -611,6 +685,9 @@ config = json.loads(config_str)
 
 app.secret_key = config['secret_key']
 
+# Short-lived cache for user rows and counts, see get_user()
+user_cache = TTLCache(config.get('userCacheTTL', 5))
+
 # Convert start date to python object
 if config['startTime']:
     config['startTime'] = dateutil.parser.parse(config['startTime'])
@@ -625,11 +702,34 @@ lang = json.loads(lang_str)
 lang = lang[config['language']]
 
 # Connect to database
-db = dataset.connect(config['db'])
+db = storage.connect(config['db'], config.get('sqlite'))
+
+# Task grid model for /tasks, see cache.TaskGrid
+task_grid = TaskGrid(db, config.get('taskGridTTL', 10))
+
+# Materialized scoreboard, see scores.py
+scores.ensure_schema(db)
+scoreboard_cache = scores.Scoreboard(db)
+
+# In-memory flag map and rate limits, see submission.py
+submissions = Submissions(db, config.get('taskGridTTL', 10),
+    config.get('submitRate', 1), config.get('submitBurst', 10),
+    config.get('submitIpRate', 5), config.get('submitIpBurst', 30),
+    config.get('submitBatchMax', 10))
+
+# Solve feed for /events
+solve_events = SolveEvents(db, config.get('eventsInterval', 1),
+    max_clients=config.get('eventsMaxClients', 1000))
+
+# Background snapshots for /makedump, see dump.py
+dumper = dump.Dumper(config['db'], config.get('dumpDir', 'dumps'))
 
 if config['isProxied']:
     app.wsgi_app = ProxyFix(app.wsgi_app)
 
+# Hand attachment downloads to the front server, see attachments.py
+app.use_x_sendfile = config.get('attachments', {}).get('xSendfile', False)
+
 if __name__ == '__main__':
     # Start web server
     app.run(host=config['host'], port=config['port'],
@@ -0,0 +1,69 @@
+var feed = $("#solve-feed");
+var reload = null;
+
+function refreshScoreboard() {
+    $("#scoreboard").load("/scoreboard #scoreboard > *");
+}
+
+// same order as scores.SCOREBOARD_QUERY: score desc, last_submit asc
+function byScore(a, b) {
+    var sa = +$(a).attr("data-score"), sb = +$(b).attr("data-score");
+    if (sa != sb) return sb - sa;
+    return (+$(a).attr("data-last-submit") || 0) - (+$(b).attr("data-last-submit") || 0);
+}
+
+// the event carries everything the solver's row needs, so only that row
+// changes and no viewer has to ask the server for the scoreboard again
+function updateScoreboard(data) {
+    // looked up every time: a reload replaces the table body
+    var board = $("#scoreboard > tbody");
+    var row = board.children("tr[data-user-id='" + data["user_id"] + "']");
+    if (!row.length) {
+        // a player registered after this page was loaded: one reload,
+        // spread over a few seconds so viewers do not come all at once
+        clearTimeout(reload);
+        reload = setTimeout(refreshScoreboard, 1000 + Math.random() * 9000);
+        return;
+    }
+
+    var score = +row.attr("data-score") + data["score"];
+    row.attr("data-score", score).attr("data-last-submit", data["timestamp"]);
+    row.children("td.score").children("div").text(score);
+
+    var rows = board.children("tr").get().sort(byScore);
+    $.each(rows, function(i, tr) {
+        $(tr).children("td").first().children("div").text(i + 1);
+    });
+    board.append(rows);
+}
+
+function onSolve(e) {
+    var data = JSON.parse(e.data);
+    var text = data["user"] + " " + feed.data("solved") + " " +
+        data["category"] + " / " + data["task"];
+    var item = $("<li></li>").text(text);
+    if (data["first_blood"]) {
+        item.append($("<b></b>").text(" " + feed.data("first-blood")));
+    }
+    feed.prepend(item);
+    feed.children().slice(10).remove();
+
+    if ($("#scoreboard").length) {
+        updateScoreboard(data);
+    }
+}
+
+function connect() {
+    var source = new EventSource("/events");
+    source.addEventListener("solve", onSolve);
+    source.onerror = function() {
+        // the browser retries by itself unless the server refused (503)
+        if (source.readyState == EventSource.CLOSED) {
+            setTimeout(connect, 10000 + Math.random() * 20000);
+        }
+    };
+}
+
+if (window.EventSource) {
+    connect();
+}
@@ -0,0 +1,105 @@
+"""storage.py -- database connection for the flask server
+
+Opens the dataset database, tunes every new SQLite connection with
+PRAGMAs (WAL journal, synchronous, cache and mmap sizes, busy timeout)
+and creates the indexes the queries rely on.
+
+dataset keeps one connection per thread, in a dict keyed by the thread
+ident that it never cleans up itself, and SQLite connections are not
+pooled (NullPool). The server therefore calls release() when a request
+ends: the thread's connection is closed and the next request opens a
+fresh one. Background threads hold theirs for as long as they run.
+"""
+
+import threading
+
+import dataset
+
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+
+DEFAULTS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -65536,
+    "mmap_size": 268435456,
+    "busy_timeout": 10000
+}
+
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SYNCHRONOUS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+INDEXES = [
+    ('flags', 'user_id'),
+    ('tasks', 'category'),
+    ('users', 'email'),
+    ('users', 'username'),
+]
+
+def pragma_statements(options):
+    """PRAGMA statements for the options; names are checked, numbers cast"""
+
+    journal_mode = str(options['journal_mode']).upper()
+    synchronous = str(options['synchronous']).upper()
+    if journal_mode not in JOURNAL_MODES:
+        raise ValueError('Unknown journal_mode: %r' % options['journal_mode'])
+    if synchronous not in SYNCHRONOUS:
+        raise ValueError('Unknown synchronous: %r' % options['synchronous'])
+
+    # PRAGMA takes no bound parameters, hence the checks above
+    return [
+        "PRAGMA foreign_keys=ON",
+        "PRAGMA journal_mode=" + journal_mode,
+        "PRAGMA synchronous=" + synchronous,
+        "PRAGMA cache_size=%d" % int(options['cache_size']),
+        "PRAGMA mmap_size=%d" % int(options['mmap_size']),
+        "PRAGMA busy_timeout=%d" % int(options['busy_timeout']),
+    ]
+
+def release(db):
+    """Closes the calling thread's connection unless a transaction is open"""
+
+    if db.in_transaction:
+        return
+    with db.lock:
+        conn = db.connections.pop(threading.get_ident(), None)
+    if conn is not None:
+        conn.close()
+
+def connect(url, options=None):
+    """Connects to the database; options override DEFAULTS"""
+
+    pragmas = dict(DEFAULTS)
+    pragmas.update(options or {})
+
+    engine_kwargs = {}
+    statements = []
+    if url.startswith('sqlite'):
+        statements = pragma_statements(pragmas)
+        engine_kwargs = {
+            'poolclass': NullPool,
+            'connect_args': {
+                'check_same_thread': False,
+                'timeout': pragmas['busy_timeout'] / 1000.0
+            }
+        }
+
+    db = dataset.connect(url, engine_kwargs=engine_kwargs)
+
+    if statements:
+        def set_pragmas(dbapi_connection, connection_record):
+            """Enforces foreign keys and applies the tuning pragmas"""
+            cursor = dbapi_connection.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.close()
+
+        event.listen(db.engine, 'connect', set_pragmas)
+
+    tables = db.tables
+    for table, column in INDEXES:
+        if table in tables:
+            db.query('CREATE INDEX IF NOT EXISTS %s_%s ON %s (%s)' %
+                (table, column, table, column))
+
+    return db
@@ -0,0 +1,131 @@
+"""submission.py -- flag checking and rate limiting for /submit
+
+Task flags are kept in memory as SHA-256 digests and compared in constant
+time, so a wrong guess never touches the database. Only a correct flag
+costs a primary key lookup (already solved?) and the insert itself.
+
+The token buckets live in the process; under serve.py every gunicorn
+worker counts its own.
+"""
+
+import hashlib
+import hmac
+import threading
+import time
+
+
+def flag_digest(flag):
+    return hashlib.sha256(flag.encode('utf-8')).digest()
+
+
+class TokenBucket(object):
+    """Per-key token bucket: `rate` tokens per second, at most `burst`
+
+    A full bucket is the same as no bucket, so keys that have been idle
+    long enough to refill are dropped by a sweep every `sweep` seconds
+    (by default the time an empty bucket takes to fill up).
+    """
+
+    def __init__(self, rate, burst, sweep=None):
+        self.rate = rate
+        self.burst = burst
+        self.sweep = sweep if sweep is not None else max(1.0, float(burst) / rate)
+        self._buckets = {}
+        self._swept = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, key, now):
+        tokens, last = self._buckets.get(key, (self.burst, now))
+        return min(self.burst, tokens + (now - last) * self.rate)
+
+    def available(self, key):
+        """Tokens the key has right now, nothing is taken"""
+
+        with self._lock:
+            return self._refill(key, time.monotonic())
+
+    def _prune(self, now):
+        self._swept = now
+        full = [key for key in self._buckets if self._refill(key, now) >= self.burst]
+        for key in full:
+            del self._buckets[key]
+
+    def take(self, key, count=1):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._swept >= self.sweep:
+                self._prune(now)
+            tokens = self._refill(key, now)
+            if tokens < count:
+                self._buckets[key] = (tokens, now)
+                return False
+            self._buckets[key] = (tokens - count, now)
+            return True
+
+
+class Submissions(object):
+    """In-memory task id -> flag digest map plus submission rate limits"""
+
+    def __init__(self, db, ttl, user_rate, user_burst, ip_rate, ip_burst,
+            batch_max=20):
+        self.db = db
+        self.ttl = ttl
+        self.users = TokenBucket(user_rate, user_burst)
+        self.ips = TokenBucket(ip_rate, ip_burst)
+        # a batch bigger than a full bucket could never be allowed
+        self.batch_max = min(batch_max, user_burst, ip_burst)
+        self._tasks = {}
+        self._expires = 0
+        self._lock = threading.Lock()
+        self._limit_lock = threading.Lock()
+
+    def _ensure(self):
+        if time.monotonic() >= self._expires:
+            with self._lock:
+                if time.monotonic() >= self._expires:
+                    tasks = {}
+                    for t in self.db.query("SELECT id, flag, score FROM tasks"):
+                        # a task without a flag cannot be solved at all
+                        if t['flag']:
+                            tasks[t['id']] = (flag_digest(t['flag']), t['score'])
+                    self._tasks = tasks
+                    self._expires = time.monotonic() + self.ttl
+
+    def invalidate(self):
+        """Forces a reload of the flag map (call after admin edits)"""
+
+        self._expires = 0
+
+    def allow(self, user_id, ip, count=1):
+        """Takes count tokens from both the user's and the ip's bucket.
+
+        Nothing is taken unless both buckets have enough, so a rejected
+        request does not cost the user tokens.
+        """
+
+        with self._limit_lock:
+            if self.users.available(user_id) < count or \
+                    self.ips.available(ip) < count:
+                return False
+            return self.users.take(user_id, count) and self.ips.take(ip, count)
+
+    def check(self, tid, flag):
+        """Returns the task score if the flag is correct, None otherwise"""
+
+        if not flag:
+            return None
+
+        self._ensure()
+        task = self._tasks.get(tid)
+        if task is None:
+            return None
+
+        digest, score = task
+        if hmac.compare_digest(digest, flag_digest(flag)):
+            return score
+        return None
+
+    def is_solved(self, tid, user_id):
+        row = self.db.query('''SELECT 1 FROM flags WHERE task_id = :tid
+            AND user_id = :user_id LIMIT 1''', tid=tid, user_id=user_id)
+        return next(iter(row), None) is not None
@@ -0,0 +1,147 @@
+"""checklib.py -- shared support for service checkers
+
+Status codes, the name corpora used to generate and validate data, and
+the command line harness every checker ends with:
+
+    checker.py check <host>
+    checker.py put <host> <flag_id> <flag>
+    checker.py get <host> <flag_id> <flag>
+    checker.py round <host> <flag_id> <flag>
+
+"round" runs check, put and get in one process and one session with the
+service, stops at the first failure and prints a last line
+"ROUND {json}" with the code and duration of every step it ran.
+
+The corpora live in data/*.txt (one name per line) and are read on first
+use only, instead of being parsed out of list literals on every start.
+"""
+
+import functools
+import json
+import os
+import random
+import re
+import socket
+import sys
+import time
+
+UP = 101
+CORRUPT = 102
+MUMBLE = 103
+DOWN = 104
+USAGE = 110
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# re.compile with a cache that is not shared with (and flushed by) re
+pattern = functools.lru_cache(maxsize=None)(re.compile)
+
+
+class Names(object):
+    """A name corpus: exact lookups, substring lookups and random picks"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._words = None
+
+    def _load(self):
+        if self._words is None:
+            with open(os.path.join(DATA_DIR, self.filename)) as f:
+                blob = f.read()
+            words = tuple(blob.split())
+            self._set = frozenset(words)
+            # one line per name: "x in blob" is a substring search over
+            # all names at once, done in C
+            self._blob = '\n' + '\n'.join(words) + '\n'
+            self._words = words
+        return self._words
+
+    def __contains__(self, name):
+        self._load()
+        return name in self._set
+
+    def __len__(self):
+        return len(self._load())
+
+    def contains_substring(self, text):
+        """True if text is a part of some name (text has no line breaks)"""
+
+        self._load()
+        return '\n' not in text and text in self._blob
+
+    def choice(self, rnd=random):
+        return rnd.choice(self._load())
+
+
+FIRST_NAMES = Names('first_names.txt')
+LAST_NAMES = Names('last_names.txt')
+
+
+def reachable(host, port, timeout=2):
+    """TCP connect to the service port, no ICMP and no subprocess needed"""
+
+    try:
+        socket.create_connection((host, int(port)), timeout).close()
+        return True
+    except OSError:
+        return False
+
+
+def status(result):
+    """Turns a checker function's return value into an exit code"""
+
+    if isinstance(result, int):
+        return result
+    if isinstance(result, str) and result.isdigit():
+        return int(result)
+    if result is not None:
+        print(result)
+    return MUMBLE
+
+
+def run(action, *args):
+    """Calls a checker function, mapping exceptions to status codes"""
+
+    try:
+        return status(action(*args))
+    except (OSError, EOFError) as e:
+        print("Service is down: %r" % e)
+        return DOWN
+    except Exception as e:
+        print("Checker failed: %r" % e)
+        return MUMBLE
+
+
+def round_action(check, put, get):
+    """Builds the "round" action from check, put (without its own check) and get"""
+
+    def action(host, flag_id, flag):
+        steps = []
+        code = UP
+        for name, step, args in (('check', check, (host,)),
+                ('put', put, (host, flag_id, flag)),
+                ('get', get, (host, flag_id, flag))):
+            started = time.perf_counter()
+            code = run(step, *args)
+            steps.append({'action': name, 'code': code,
+                'time': round(time.perf_counter() - started, 4)})
+            if code != UP:
+                break
+        print("ROUND " + json.dumps(steps))
+        return code
+
+    return action
+
+
+def main(actions, argv=None):
+    """Runs the action named by argv[1] and exits with its status code"""
+
+    argv = sys.argv if argv is None else argv
+    arity = {'check': 1, 'put': 3, 'get': 3, 'round': 3}
+
+    if len(argv) < 2 or argv[1] not in actions or len(argv) < 2 + arity.get(argv[1], 0):
+        print("Usage: %s check|put|get|round <host> [<flag_id> <flag>]" % os.path.basename(argv[0]))
+        sys.exit(USAGE)
+
+    action = argv[1]
+    sys.exit(run(actions[action], *argv[2:2 + arity.get(action, len(argv) - 2)]))
@@ -1,41 +1,79 @@
-import subprocess, os, dataset
-from xmlrpc.server import SimpleXMLRPCServer
+import subprocess, threading
+from concurrent.futures import ThreadPoolExecutor
+from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+from fails import Fails
 
-server = SimpleXMLRPCServer(("localhost", 14880))
+HOST = "localhost"
+PORT = 14880
+WORKERS = 32          # calls served at once
+QUEUE = 128           # accepted connections waiting for a worker
+IDLE_TIMEOUT = 10     # seconds a keep-alive connection may stay silent
+CALL_TIMEOUT = 5      # seconds for a command run by untouchable
 
-if os.path.isfile("DatabaseFails.db") == False:
-    db = dataset.connect('sqlite:///DatabaseFails.db')
-    db.query('CREATE TABLE IF NOT EXISTS `fails` (`experiment_number` INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL , `secret` varchar(255) NOT NULL);')
-else:
-    db = dataset.connect('sqlite:///DatabaseFails.db')
+class RequestHandler(SimpleXMLRPCRequestHandler):
+    # HTTP/1.1 keeps the connection open between calls of one client
+    protocol_version = "HTTP/1.1"
+    timeout = IDLE_TIMEOUT
+
+    def log_message(self, format, *args):
+        pass
+
+class PoolXMLRPCServer(SimpleXMLRPCServer):
+    """Serves every connection in a bounded pool of worker threads"""
+
+    allow_reuse_address = True
+    request_queue_size = QUEUE
+
+    def __init__(self, addr, workers=WORKERS, queue=QUEUE):
+        SimpleXMLRPCServer.__init__(self, addr, requestHandler=RequestHandler,
+            logRequests=False, allow_none=True)
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        # accept() stops when all workers and the queue are busy
+        self.slots = threading.BoundedSemaphore(workers + queue)
+
+    def process_request(self, request, client_address):
+        self.slots.acquire()
+        self.pool.submit(self._work, request, client_address)
+
+    def _work(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.slots.release()
+
+    def server_close(self):
+        SimpleXMLRPCServer.server_close(self)
+        self.pool.shutdown(wait=False)
+
+fails = Fails('DatabaseFails.db')
 
 def new(secret):
-    resutl = db.query("INSERT INTO fails (secret) VALUES ('%s');" % ('%s'*len(secret) % tuple(map(ord, secret))))
-    result = db.query("SELECT last_insert_rowid() as rowid FROM fails;")
-    for row in result:
-        guid = row['rowid']
+    guid = fails.add(secret)
     return("Information about secret #%s added" % guid)
 
 def output(number):
-    result = db.query("SELECT * FROM fails WHERE experiment_number = %s" % number)
-    one = ""
-    for row in result:
-        one += str('Experiment Number: ') + str(row['experiment_number']) + str('  Info about Experiment (encrypted): ') + str(row['secret'][::-1]) + "\r\n"
-    return(one)
+    result = fails.select("SELECT experiment_number, secret FROM fails WHERE experiment_number = %s" % number)
+    return(''.join('Experiment Number: ' + str(row[0]) + '  Info about Experiment (encrypted): ' + str(row[1])[::-1] + "\r\n" for row in result))
 
-def test(login, password):
+def test(login, password, after=0, limit=0):
+    """All secrets, or `limit` of them after experiment number `after`"""
     if login == 'admin' and password == 'VeryHardPass':
-        result = ''
-        for id in db['fails'].all():
-            result += str(id['secret']) + "      "
-        return(result)
+        parts = []
+        for rows in fails.pages(after, limit):
+            parts.extend(str(row[1]) + "      " for row in rows)
+        return(''.join(parts))
 
 def untouchable(info):
-    return(subprocess.check_output([info]))
+    return(subprocess.check_output([info], timeout=CALL_TIMEOUT))
 
 def arbeiten():
     return("Ja Sire")
 
+server = PoolXMLRPCServer((HOST, PORT))
+
 print ("Ist bereit, Sire")
 server.register_function(new)
 server.register_function(output)
@@ -0,0 +1,75 @@
+#!/usr/bin/python
+"""Load test for SecretRPC: calls/sec under concurrent clients
+
+    python bench.py --host localhost --clients 50 --seconds 10
+    python bench.py --prefill 1000000 --db DatabaseFails.db   # grow the table first
+"""
+
+import argparse, random, string, threading, time
+import xmlrpc.client
+
+def client(url, deadline, stats, lock):
+    server = xmlrpc.client.ServerProxy(url)
+    latencies = []
+    errors = 0
+    guid = None
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        try:
+            kind = random.random()
+            if kind < 0.4 or guid is None:
+                secret = ''.join(random.choice(string.ascii_letters) for _ in range(16))
+                status = server.new(secret)
+                guid = status.split('#')[1].split(' ')[0]
+            elif kind < 0.8:
+                server.output(guid)
+            else:
+                server.arbeiten()
+        except Exception:
+            errors += 1
+            server = xmlrpc.client.ServerProxy(url)
+            continue
+        latencies.append(time.perf_counter() - started)
+    with lock:
+        stats['latencies'].extend(latencies)
+        stats['errors'] += errors
+
+def main():
+    parser = argparse.ArgumentParser(description='SecretRPC load test')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=14880)
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--prefill', type=int, default=0)
+    parser.add_argument('--db', default='DatabaseFails.db')
+    args = parser.parse_args()
+
+    if args.prefill:
+        from fails import Fails
+        started = time.perf_counter()
+        Fails(args.db).add_many(''.join(random.choice(string.ascii_letters) for _ in range(16))
+            for _ in range(args.prefill))
+        print("%d secrets added in %.1f s" % (args.prefill, time.perf_counter() - started))
+
+    url = "http://%s:%d" % (args.host, args.port)
+    stats = {'latencies': [], 'errors': 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.seconds
+    threads = [threading.Thread(target=client, args=(url, deadline, stats, lock))
+        for _ in range(args.clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    latencies = sorted(stats['latencies'])
+    if not latencies:
+        print("no successful calls, %d errors" % stats['errors'])
+        return
+    pct = lambda p: latencies[max(0, int(len(latencies) * p / 100) - 1)] * 1000
+    print("%d clients, %.0f s: %d calls, %.0f calls/s, p50 %.2f ms, p99 %.2f ms, %d errors" % (
+        args.clients, args.seconds, len(latencies), len(latencies) / args.seconds,
+        pct(50), pct(99), stats['errors']))
+
+if __name__ == '__main__':
+    main()
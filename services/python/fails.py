@@ -0,0 +1,64 @@
+import sqlite3, threading
+
+PAGE = 1000
+
+SCHEMA = 'CREATE TABLE IF NOT EXISTS `fails` (`experiment_number` INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL , `secret` varchar(255) NOT NULL);'
+
+def encode(secret):
+    return ''.join(str(ord(c)) for c in secret)
+
+class Fails:
+    """The fails table: one sqlite3 connection per thread, WAL journal"""
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.conn().execute(SCHEMA)
+
+    def conn(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            # autocommit, transactions are opened explicitly below
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def add(self, secret):
+        """Stores a secret, returns its experiment number"""
+        return self.conn().execute("INSERT INTO fails (secret) VALUES (?)",
+            (encode(secret),)).lastrowid
+
+    def add_many(self, secrets, batch=PAGE):
+        """Stores many secrets, one transaction per batch"""
+        conn = self.conn()
+        secrets = list(secrets)
+        for i in range(0, len(secrets), batch):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("INSERT INTO fails (secret) VALUES (?)",
+                    [(encode(s),) for s in secrets[i:i + batch]])
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def select(self, query):
+        return self.conn().execute(query).fetchall()
+
+    def pages(self, after=0, limit=0, page=PAGE):
+        """Yields lists of (number, secret) ordered by number, page by page"""
+        conn = self.conn()
+        left = limit or -1
+        while left:
+            size = page if left < 0 else min(page, left)
+            rows = conn.execute("SELECT experiment_number, secret FROM fails "
+                "WHERE experiment_number > ? ORDER BY experiment_number LIMIT ?",
+                (after, size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            after = rows[-1][0]
+            if left > 0:
+                left -= len(rows)
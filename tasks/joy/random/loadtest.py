@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+"""Load test for the random task: many players at once, latency per turn
+
+    python3 server.py &
+    python3 loadtest.py --players 200 --turns 100 --pause 0.5
+
+Every player plays like solve.py (a bare random word per turn) and
+measures a turn from sending its word to receiving the next prompt.
+Between turns a player thinks for up to --pause seconds (random), as
+players behind a network do; with --pause 0 all of them hammer the
+server back to back and the numbers show throughput instead.
+Players are spread over 127.0.0.x source addresses, --per-ip of them on
+each, so the server's per-IP cap is not hit on a single machine.
+"""
+
+import argparse
+import random
+import socket
+import threading
+import time
+
+a = ["ножницы", "бумага", "камень"]
+PROMPT = "Введи своё значение\n".encode()
+FLAG = b"SCTF{"
+
+
+def player(host, port, source, turns, pause, start, stats, lock):
+    latencies = []
+    error = None
+    try:
+        s = socket.create_connection((host, port), 10, (source, 0))
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        buf = b""
+        start.wait()
+        while not buf.endswith(PROMPT):
+            data = s.recv(4096)
+            if not data:
+                raise EOFError("closed before the first prompt")
+            buf += data
+        for _ in range(turns):
+            if pause:
+                time.sleep(random.random() * pause)
+            buf = b""
+            started = time.perf_counter()
+            s.send(random.choice(a).encode())
+            while not buf.endswith(PROMPT) and FLAG not in buf:
+                data = s.recv(4096)
+                if not data:
+                    raise EOFError("closed: %r" % buf[-100:])
+                buf += data
+            latencies.append(time.perf_counter() - started)
+            if FLAG in buf:
+                break
+        s.close()
+    except Exception as e:
+        error = e
+    with lock:
+        stats['latencies'].extend(latencies)
+        if error is not None:
+            stats['errors'].append(error)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='random task load test')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9001)
+    parser.add_argument('--players', type=int, default=200)
+    parser.add_argument('--turns', type=int, default=100)
+    parser.add_argument('--pause', type=float, default=0.5)
+    parser.add_argument('--per-ip', type=int, default=8)
+    args = parser.parse_args()
+
+    stats = {'latencies': [], 'errors': []}
+    lock = threading.Lock()
+    start = threading.Event()
+    threads = []
+    for i in range(args.players):
+        source = '127.0.0.%d' % (1 + i // args.per_ip)
+        t = threading.Thread(target=player, args=(args.host, args.port, source,
+            args.turns, args.pause, start, stats, lock))
+        t.start()
+        threads.append(t)
+
+    time.sleep(1)  # all players connected and waiting
+    started = time.monotonic()
+    start.set()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - started
+
+    latencies = sorted(stats['latencies'])
+    print("players: %d  turns: %d  errors: %d  time: %.1f s" % (
+        args.players, len(latencies), len(stats['errors']), elapsed))
+    for e in stats['errors'][:3]:
+        print("  error: %r" % e)
+    if latencies:
+        pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+        print("turn latency, ms: p50 %.2f  p90 %.2f  p99 %.2f  max %.2f" % (
+            pick(0.5), pick(0.9), pick(0.99), latencies[-1] * 1000))
+
+
+if __name__ == "__main__":
+    main()
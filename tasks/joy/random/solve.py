@@ -1,20 +1,29 @@
 import socket
-s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-s.connect(("192.168.1.5", 7788))
 import random
 import re
 a = ["ножницы","бумага","камень"]
-print(s.recv(200).decode())
-print(s.recv(218).decode())
-while 1:
-    data = s.recv(1024).decode()
-    print(data)
-    flags = re.findall("SCTF\{\w{0,20}\}", data)
-    print(flags)
-    if len(flags) != 0: break
-    n = random.randint(0,2)
-    s.send(a[n].encode())
-    data = s.recv(1024).decode()
-    print(data)
-s.close()
-
+prompt = "Введи своё значение\n".encode()
+# сервер отвечает на ход одним куском: результат, счет и новое приглашение,
+# поэтому читаем до приглашения (или флага), а не фиксированными recv
+def read(s):
+    data = b""
+    while not data.endswith(prompt) and b"SCTF{" not in data:
+        chunk = s.recv(1024)
+        if not chunk: break
+        data += chunk
+    return data
+flags = []
+# после нескольких десятков игр сервер закрывает соединение - подключаемся снова
+while len(flags) == 0:
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.connect(("192.168.1.5", 7788))
+    data = read(s)
+    print(data.decode())
+    while data.endswith(prompt):
+        n = random.randint(0,2)
+        s.send(a[n].encode())
+        data = read(s)
+        print(data.decode())
+        flags = re.findall("SCTF\{\w{0,20}\}", data.decode())
+        print(flags)
+    s.close()
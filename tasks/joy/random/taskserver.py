@@ -0,0 +1,158 @@
+"""taskserver.py -- asyncio core for the question/answer task services
+
+One event loop serves every player; a task only writes the game itself:
+
+    async def game(session):
+        await session.send_line("2 + 2?")
+        if await session.ask() != "4":
+            ...
+
+    TaskServer(game, port=9002).run()
+
+Signal handlers passed as signals={signal.SIGHUP: reload} run on the
+event loop (loop.add_signal_handler), between two game steps.
+
+Framing: answers are read as lines ("\\n" terminated), questions go out
+as lines (send_line) or as a 4-byte big-endian length plus payload
+(send_frame). Tasks whose players send bare words without a newline
+read them with recv, one read per message. The answer deadline starts
+once the question has been handed to the kernel (after drain), so it
+measures the player's response time rather than how busy the server is.
+Connections are capped overall and per IP address.
+
+Each task is built from its own directory, so an identical copy of this
+file lives next to every server.py that uses it.
+"""
+
+import asyncio
+import struct
+
+LINE_LIMIT = 1024
+FRAME_HEADER = struct.Struct('>I')
+
+
+def frame(payload):
+    """A length-prefixed frame, to build once and send many times"""
+
+    return FRAME_HEADER.pack(len(payload)) + bytes(payload)
+
+
+class Deadline(Exception):
+    """The player did not answer in time"""
+
+
+class Disconnected(Exception):
+    """The player closed the connection or broke the framing"""
+
+
+class Session(object):
+    def __init__(self, reader, writer, ip, timeout):
+        self.reader = reader
+        self.writer = writer
+        self.ip = ip
+        self.timeout = timeout
+
+    async def send(self, *chunks):
+        """Writes bytes-like chunks without joining them and waits for drain"""
+
+        self.writer.writelines(chunks)
+        await self.writer.drain()
+
+    async def send_line(self, text):
+        await self.send(text.encode('utf-8') + b'\n')
+
+    async def send_frame(self, payload):
+        await self.send(FRAME_HEADER.pack(len(payload)), payload)
+
+    async def send_framed(self, data):
+        """Sends a frame() built in advance, without copying it"""
+
+        await self.send(memoryview(data))
+
+    async def ask(self, timeout=None):
+        """Reads one answer line within the deadline, without the newline"""
+
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            line = await asyncio.wait_for(self.reader.readline(), timeout)
+        except asyncio.TimeoutError:
+            raise Deadline()
+        except (ValueError, asyncio.LimitOverrunError, ConnectionError):
+            raise Disconnected()
+        if not line.endswith(b'\n'):
+            raise Disconnected()
+        return line[:-1].rstrip(b'\r').decode('utf-8', 'replace')
+
+    async def recv(self, timeout=None):
+        """Reads whatever one message of an unframed protocol brought, stripped"""
+
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            data = await asyncio.wait_for(self.reader.read(LINE_LIMIT), timeout)
+        except asyncio.TimeoutError:
+            raise Deadline()
+        except ConnectionError:
+            raise Disconnected()
+        if not data:
+            raise Disconnected()
+        return data.decode('utf-8', 'replace').strip()
+
+
+class TaskServer(object):
+    def __init__(self, game, host='', port=9000, timeout=1.0,
+            max_connections=1024, per_ip=8, session_timeout=600, signals=None):
+        self.game = game
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.per_ip = per_ip
+        self.session_timeout = session_timeout
+        self.signals = signals or {}
+        self.connections = 0
+        self.by_ip = {}
+
+    async def handle(self, reader, writer):
+        ip = (writer.get_extra_info('peername') or ('?',))[0]
+
+        if self.connections >= self.max_connections or \
+                self.by_ip.get(ip, 0) >= self.per_ip:
+            writer.write(b'TOO MANY CONNECTIONS\n')
+            writer.close()
+            return
+
+        self.connections += 1
+        self.by_ip[ip] = self.by_ip.get(ip, 0) + 1
+        session = Session(reader, writer, ip, self.timeout)
+        print("%s: connected" % ip)
+        try:
+            await asyncio.wait_for(self.game(session), self.session_timeout)
+        except Deadline:
+            print("%s: too slow" % ip)
+            writer.write(b'TOO SLOW\n')
+        except (Disconnected, ConnectionError, asyncio.TimeoutError):
+            print("%s: disconnected" % ip)
+        finally:
+            self.connections -= 1
+            self.by_ip[ip] -= 1
+            if not self.by_ip[ip]:
+                del self.by_ip[ip]
+            writer.close()
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        for signum, handler in self.signals.items():
+            loop.add_signal_handler(signum, handler)
+        server = loop.run_until_complete(asyncio.start_server(self.handle,
+            self.host or None, self.port, limit=LINE_LIMIT, reuse_address=True,
+            backlog=512))
+        print("listening on %s:%d" % (self.host or '*', self.port))
+        try:
+            loop.run_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
@@ -1,14 +1,15 @@
 import socket
 
 sock = socket.socket()
-sock.connect(('localhost', 6000))
+sock.connect(('localhost', 9002))
+stream = sock.makefile('rw', encoding='utf-8', newline='\n')
 
-    #n = input("\n\nTrue, False or Correct?: ")
-    #sock.send(str.encode(n))
+# every question is one line, every answer must be one line
 for i in range(100):
-    data = sock.recv(4096)
-    print(data.decode('utf-8'))
+    word = stream.readline().rstrip('\n')
+    print(word)
     n = input("Eatable or noteatable (1 sec)? ")
-    sock.send(bytearray(n.encode('utf-8')))
+    stream.write(n + '\n')
+    stream.flush()
 print("WTF")
 sock.close()
@@ -1,26 +1,249 @@
+"""parser.py -- builds the word corpus from VK board comments
+
+    python3 parser.py                        # crawl, resume if crawl.json exists
+    python3 parser.py --fresh --rate 3 --workers 8
+    python3 parser.py --api http://127.0.0.1:8088/method   # offline, see vkfixture.py
+
+Pages of every topic are fetched concurrently by a pool of workers that
+share one rate limiter (VK allows a few requests per second). Words are
+deduplicated in memory and written to results.txt once, as SQL inserts.
+Progress (done pages per topic and the words so far) is saved to a
+checkpoint file, so an interrupted crawl continues where it stopped.
+"""
+
+import argparse
+import asyncio
 import json
-import urllib.request
+import os
+import re
 import time
-urls = [
-"https://api.vk.com/method/board.getComments?group_id=36630127&topic_id=26148249&v=5.52&count=20&start_comment_id={}",
-"https://api.vk.com/method/board.getComments?group_id=78357132&topic_id=31151601&v=5.52&count=20&start_comment_id={}",
-"https://api.vk.com/method/board.getComments?group_id=41959405&topic_id=27874501&v=5.52&count=20&start_comment_id={}",
-"https://api.vk.com/method/board.getComments?group_id=8999834&topic_id=21905779&v=5.52&count=20&start_comment_id={}",
+from concurrent.futures import ThreadPoolExecutor
+import urllib.parse
+import urllib.request
+
+API = "https://api.vk.com/method"
+VERSION = "5.52"
+PAGE = 100               # board.getComments returns at most 100 comments
+TOPICS = [
+    (36630127, 26148249),
+    (78357132, 31151601),
+    (41959405, 27874501),
+    (8999834, 21905779),
 ]
-f = open("results.txt", "w")
-for s in range (len(urls)):
-    print("PUBLIC %d " % s)
-    url = urls[s].format('0')
-    r = urllib.request.urlopen(url)
-    d = json.loads(r.read().decode("utf-8"))
-    count = d['response']['count']
-    for i in range(0, int(count/20)):
-        print("%d" % (i * 20))
-        url = urls[s].format(i * 20)
-        r = urllib.request.urlopen(url)
-        d = json.loads(r.read().decode("utf-8"))
-        for item in d['response']['items']:
-            #print(item['text'])
-            f.write("INSERT INTO words (word) VALUES (\'%s\') ON CONFLICT (word) DO NOTHING;\n" % (re.sub('[^A-Za-z0-9]+', '', item['text'][0:26].upper())))
-        time.sleep(0.2)
-f.close()
+RETRIES = 5
+TOO_MANY_REQUESTS = 6    # VK error code
+CHECKPOINT_EVERY = 2.0   # seconds
+
+not_word = re.compile('[^A-ZА-ЯЁ0-9]+')
+
+
+def word_of(text):
+    """The corpus form of a comment: letters and digits of its start, upper case"""
+
+    return not_word.sub('', text[0:26].upper())
+
+
+class RateLimiter(object):
+    """Spaces requests of all workers at least 1/rate seconds apart"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        slot = max(now, self.next)
+        self.next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class Checkpoint(object):
+    """Done pages per topic and the words found so far, in a JSON file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.counts = {}
+        self.done = {}
+        self.words = {}      # word -> None, a set that keeps the crawl order
+        self.saved = time.monotonic()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return self
+        with open(self.path, encoding='utf-8') as f:
+            state = json.load(f)
+        self.counts = state['counts']
+        self.done = {topic: set(offsets) for topic, offsets in state['done'].items()}
+        self.words = dict.fromkeys(state['words'])
+        return self
+
+    def save(self):
+        if not self.path:
+            return
+        state = {
+            'counts': self.counts,
+            'done': {topic: sorted(offsets) for topic, offsets in self.done.items()},
+            'words': list(self.words),
+        }
+        # written aside and renamed, so a crash never leaves half a file
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self.saved = time.monotonic()
+
+    def maybe_save(self):
+        if time.monotonic() - self.saved >= CHECKPOINT_EVERY:
+            self.save()
+
+
+class Crawler(object):
+    def __init__(self, topics, checkpoint, api=API, token=None, rate=3.0,
+            workers=8, timeout=10):
+        self.topics = topics
+        self.checkpoint = checkpoint
+        self.api = api.rstrip('/')
+        self.token = token
+        self.limiter = RateLimiter(rate)
+        self.workers = workers
+        self.timeout = timeout
+        self.requests = 0
+        # urllib blocks, so requests run in threads, one per worker
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def url(self, group_id, topic_id, offset):
+        params = {'group_id': group_id, 'topic_id': topic_id, 'v': VERSION,
+                  'count': PAGE, 'offset': offset}
+        if self.token:
+            params['access_token'] = self.token
+        return "%s/board.getComments?%s" % (self.api, urllib.parse.urlencode(params))
+
+    def _get(self, url):
+        with urllib.request.urlopen(url, timeout=self.timeout) as r:
+            return json.loads(r.read().decode('utf-8'))
+
+    async def page(self, group_id, topic_id, offset):
+        """One page of comments: the 'response' object, retried with backoff"""
+
+        loop = asyncio.get_event_loop()   # the running loop, inside a coroutine
+        url = self.url(group_id, topic_id, offset)
+        for attempt in range(RETRIES):
+            await self.limiter.wait()
+            self.requests += 1
+            try:
+                d = await loop.run_in_executor(self.pool, self._get, url)
+            except (OSError, ValueError) as e:
+                error = e
+            else:
+                if 'response' in d:
+                    return d['response']
+                error = d.get('error', d)
+                if not isinstance(error, dict) or error.get('error_code') != TOO_MANY_REQUESTS:
+                    raise RuntimeError("VK error: %r" % error)
+            await asyncio.sleep(0.5 * 2 ** attempt)
+        raise RuntimeError("%s: %r" % (url, error))
+
+    def add(self, key, offset, response):
+        words = self.checkpoint.words
+        for item in response['items']:
+            word = word_of(item.get('text', ''))
+            if word:
+                words.setdefault(word)
+        self.checkpoint.done.setdefault(key, set()).add(offset)
+        self.checkpoint.maybe_save()
+
+    async def worker(self, queue):
+        while True:
+            key, group_id, topic_id, offset = await queue.get()
+            try:
+                self.add(key, offset, await self.page(group_id, topic_id, offset))
+            except Exception as e:
+                print("%s offset %d failed: %s" % (key, offset, e))
+            finally:
+                queue.task_done()
+
+    async def crawl(self):
+        queue = asyncio.Queue()
+        workers = [asyncio.ensure_future(self.worker(queue)) for _ in range(self.workers)]
+        counts = self.checkpoint.counts
+
+        # the first page of a topic also brings its size; all first pages
+        # go at once, then every remaining page
+        async def first(group_id, topic_id):
+            key = "%d_%d" % (group_id, topic_id)
+            if key not in counts:
+                response = await self.page(group_id, topic_id, 0)
+                counts[key] = response['count']
+                self.add(key, 0, response)
+            done = self.checkpoint.done.get(key, ())
+            todo = [o for o in range(0, counts[key], PAGE) if o not in done]
+            print("%s: %d comments, %d pages left" % (key, counts[key], len(todo)))
+            for offset in todo:
+                queue.put_nowait((key, group_id, topic_id, offset))
+
+        try:
+            results = await asyncio.gather(*[first(g, t) for g, t in self.topics],
+                return_exceptions=True)
+            for (g, t), result in zip(self.topics, results):
+                if isinstance(result, Exception):
+                    print("%d_%d failed: %s" % (g, t, result))
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.checkpoint.save()
+
+    def complete(self):
+        counts, done = self.checkpoint.counts, self.checkpoint.done
+        return all("%d_%d" % topic in counts and
+                   len(done.get("%d_%d" % topic, ())) == len(range(0, counts["%d_%d" % topic], PAGE))
+                   for topic in self.topics)
+
+
+def write_sql(words, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        for word in words:
+            f.write("INSERT INTO words (word) VALUES (\'%s\') ON CONFLICT (word) DO NOTHING;\n" % word)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='VK board comments -> word corpus')
+    parser.add_argument('--api', default=API)
+    parser.add_argument('--token', default=os.environ.get('VK_TOKEN'))
+    parser.add_argument('--rate', type=float, default=3.0, help='requests per second, all workers')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--checkpoint', default='crawl.json')
+    parser.add_argument('--fresh', action='store_true', help='ignore the checkpoint')
+    parser.add_argument('--output', default='results.txt')
+    args = parser.parse_args()
+
+    checkpoint = Checkpoint(args.checkpoint)
+    if not args.fresh:
+        checkpoint.load()
+    crawler = Crawler(TOPICS, checkpoint, api=args.api, token=args.token,
+                      rate=args.rate, workers=args.workers)
+
+    started = time.monotonic()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    crawl = loop.create_task(crawler.crawl())
+    try:
+        loop.run_until_complete(crawl)
+    except KeyboardInterrupt:
+        # the crawl saves the checkpoint on its way out
+        crawl.cancel()
+        loop.run_until_complete(asyncio.gather(crawl, return_exceptions=True))
+        print("interrupted, progress saved to %s" % args.checkpoint)
+        return
+    finally:
+        loop.close()
+
+    write_sql(checkpoint.words, args.output)
+    print("%d words, %d requests, %.1f s%s" % (len(checkpoint.words), crawler.requests,
+          time.monotonic() - started, "" if crawler.complete() else ", some pages failed: run again"))
+
+
+if __name__ == "__main__":
+    main()
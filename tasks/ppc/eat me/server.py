@@ -1,61 +1,60 @@
-import socket
-import threading
 import random
 import csv
+import signal
+
+from taskserver import TaskServer
+
+FLAG = 'SCTF{Gr347_5ucc355!_y0u_4r3_w1n!_u53_7h1s_fl4g}'
+QUESTIONS = 500
+TIMEOUT = 1  # seconds per answer
 
-words = []
-csv.register_dialect('unixpwd', delimiter=',', quoting=csv.QUOTE_NONE)
-with open('words.csv', newline='', encoding='utf-8') as f:
-    reader = csv.reader(f)
-    for row in reader:
-        words.append(row)
 answers = ["СЪЕДОБНОЕ", "НЕСЪЕДОБНОЕ"]
-class ThreadedServer(object):
-    def __init__(self, host, port):
-        self.host = host
-        self.port = port
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.sock.bind((self.host, self.port))
-
-    def listen(self):
-        self.sock.listen(50)
-        while True:
-            client, address = self.sock.accept()
-            client.settimeout(1)
-            threading.Thread(target = self.listenToClient,args = (client,address)).start()
-
-    def listenToClient(self, client, address):
-        count = 0
-        size = 60
-        print("%s: connected" % address[0])
-        while True:
-            # word sending
-            word = random.choice(words)
-            client.send(bytearray(word[0].encode('utf-8')))
-            answer = answers[0] if word[1] == "t" else answers[1]
-            try:
-                data = client.recv(size).decode('utf-8')
-                if data:
-                    if(data == answer):
-                        count += 1
-                        if(count == 500):
-                            client.send(b'SCTF{Gr347_5ucc355!_y0u_4r3_w1n!_u53_7h1s_fl4g}')
-                            client.close()
-                            break
-                    else:
-                        client.send(b'FAIL. TRY AGAIN')
-                        client.close()
-                        break
-                    print("%s: %s %d" % (address[0], data, count))
-                else:
-                    raise error('Client disconnected')
-            except IOError as e:
-                print ("I/O error({0}): {1}".format(e.errno, e.strerror))
-                print("%s: disconnected" % address[0])
-                client.close()
-                return False
+
+# The corpus is a tuple of (question line already encoded, expected answer),
+# rebuilt from words.csv on SIGHUP and swapped in one assignment
+def load_words(path='words.csv'):
+    corpus = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0]:
+                continue
+            answer = answers[0] if row[1] == "t" else answers[1]
+            corpus.append((row[0].encode('utf-8') + b'\n', answer))
+    if not corpus:
+        raise ValueError('%s has no words' % path)
+    return tuple(corpus)
+
+words = load_words()
+
+# SIGHUP handler, run on the event loop between two questions
+def reload_words():
+    global words
+    try:
+        words = load_words()
+        print("words.csv reloaded: %d words" % len(words))
+    except (OSError, ValueError, csv.Error) as e:
+        print("words.csv not reloaded: %r" % e)
+
+rnd = random.Random().random
+
+# One word per line, the answer is one line too
+async def game(session):
+    count = 0
+    while True:
+        corpus = words
+        question, answer = corpus[int(rnd() * len(corpus))]
+        await session.send(question)
+        data = await session.ask()
+        if data != answer:
+            await session.send_line('FAIL. TRY AGAIN')
+            return
+        count += 1
+        if count == QUESTIONS:
+            await session.send_line(FLAG)
+            print("%s: solved" % session.ip)
+            return
 
 if __name__ == "__main__":
     port_num = 9002
-    ThreadedServer('',port_num).listen()
+    TaskServer(game, port=port_num, timeout=TIMEOUT,
+        signals={signal.SIGHUP: reload_words}).run()
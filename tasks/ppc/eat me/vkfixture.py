@@ -0,0 +1,109 @@
+"""vkfixture.py -- a local stand-in for VK's board.getComments
+
+    python3 vkfixture.py --port 8088 --comments 2000 --delay 0.2 --rate 20
+    python3 parser.py --api http://127.0.0.1:8088/method --rate 15
+
+Every topic has --comments comments whose texts repeat words of
+words.csv (so the crawler has duplicates to drop). Each answer is held
+for --delay seconds, like a distant API, and more than --rate requests a
+second get VK's "Too many requests per second" error (code 6).
+"""
+
+import argparse
+import csv
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+
+def load_words(path='words.csv'):
+    with open(path, newline='', encoding='utf-8') as f:
+        return [row[0] for row in csv.reader(f) if row and row[0]]
+
+
+class Fixture(object):
+    def __init__(self, words, comments, delay, rate):
+        self.words = words
+        self.comments = comments
+        self.delay = delay
+        self.rate = rate
+        self.lock = threading.Lock()
+        self.second = 0
+        self.in_second = 0
+        self.requests = 0
+
+    def allow(self):
+        with self.lock:
+            self.requests += 1
+            second = int(time.monotonic())
+            if second != self.second:
+                self.second, self.in_second = second, 0
+            self.in_second += 1
+            return not self.rate or self.in_second <= self.rate
+
+    def comment(self, topic_id, i):
+        word = self.words[(topic_id + i * 7) % len(self.words)]
+        text = word.capitalize() + ('!' if i % 3 else '')
+        return {'id': i + 1, 'from_id': 1, 'date': 0, 'text': text}
+
+    def answer(self, params):
+        if not self.allow():
+            return {'error': {'error_code': 6, 'error_msg': 'Too many requests per second'}}
+        topic_id = int(params.get('topic_id', 0))
+        offset = int(params.get('offset', 0))
+        count = min(int(params.get('count', 20)), 100)
+        items = [self.comment(topic_id, i)
+                 for i in range(offset, min(offset + count, self.comments))]
+        return {'response': {'count': self.comments, 'items': items}}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if not url.path.endswith('/board.getComments'):
+            self.send_error(404)
+            return
+        params = dict(urllib.parse.parse_qsl(url.query))
+        fixture = self.server.fixture
+        time.sleep(fixture.delay)
+        body = json.dumps(fixture.answer(params), ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='offline VK board.getComments')
+    parser.add_argument('--port', type=int, default=8088)
+    parser.add_argument('--comments', type=int, default=2000, help='per topic')
+    parser.add_argument('--delay', type=float, default=0.2, help='seconds per answer')
+    parser.add_argument('--rate', type=int, default=20, help='requests per second, 0 - unlimited')
+    args = parser.parse_args()
+
+    server = FixtureServer(('127.0.0.1', args.port), Handler)
+    server.fixture = Fixture(load_words(), args.comments, args.delay, args.rate)
+    print("serving board.getComments on 127.0.0.1:%d" % args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("%d requests" % server.fixture.requests)
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
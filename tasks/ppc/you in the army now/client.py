@@ -1,18 +1,18 @@
 import socket
+import struct
 
 sock = socket.socket()
-sock.connect(('localhost', 5000))
+sock.connect(('localhost', 9003))
+stream = sock.makefile('rwb')
 
-    #n = input("\n\nTrue, False or Correct?: ")
-    #sock.send(str.encode(n))
+# every picture is a frame: 4-byte big-endian length, then the png
 for i in range(100):
+    size, = struct.unpack('>I', stream.read(4))
     f = open("%d.png" % i, "wb")
-    data = sock.recv(4096)
-    #print(data)
-    f.write(data)
+    f.write(stream.read(size))
     f.close()
     n = input("Please recognize letter (1 sec) ")
-    sock.send(str.encode(n))
-    #sock.send(b(i))
+    stream.write((n + '\n').encode('utf-8'))
+    stream.flush()
 print("WTF")
 sock.close()
@@ -1,58 +1,40 @@
-import socket
-import threading
 import random
+
+from taskserver import TaskServer, frame
+
+FLAG = 'SCTF{Unc13_54m_d035_th3_b35t_h3_c4n}'
+QUESTIONS = 500 #for debugging. 500 for release
+TIMEOUT = 1 # for debugging. 1 sec for release
+
 tmp = ["а", "б", "в", "г", "д", "е", "ё", "ж", "з", "и", "й", "к", "л", "м", "н", "о", "п", "р", "с", "т", "у", "ф", "х", "ц", "ч", "ш", "щ", "ъ", "ы", "ь", "э", "ю", "я"]
-class ThreadedServer(object):
-    def __init__(self, host, port):
-        self.host = host
-        self.port = port
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.sock.bind((self.host, self.port))
 
-    def listen(self):
-        self.sock.listen(20)
-        while True:
-            client, address = self.sock.accept()
-            client.settimeout(1) # for debugging. 1 sec for release
-            threading.Thread(target = self.listenToClient,args = (client,address)).start()
+# All pictures are read once at start, already framed: (letter, frame)
+def load_images():
+    images = []
+    for let in tmp:
+        with open("img/%s-min.png" % let, "rb") as f:
+            images.append((let, frame(f.read())))
+    return tuple(images)
+
+images = load_images()
 
-    def listenToClient(self, client, address):
-        count = 0
-        size = 10
-        print("%s: connected" % address[0])
-        while True:
-            # file sending
-            let = random.choice(tmp)
-            f = open("img/%s-min.png" % let, "rb")
-            img = f.read(4096)
-            print(let)
-            client.send(img)
-            f.close
-            try:
-                data = client.recv(size).decode("utf-8")
-                if data:
-                    if(data == let):
-                        print ("NICE")
-                        count += 1
-                        if(count == 500): #for debugging. 500 for release
-                            print("tut")
-                            client.send(b'SCTF{Unc13_54m_d035_th3_b35t_h3_c4n}')
-                            client.close()
-                            break
-                    else:
-                        print ("FAIL")
-                        client.send(b'FAIL. TRY AGAIN')
-                        client.close()
-                        break
-                    print("%s: %s %d" % (address[0], data, count))
-                else:
-                    raise error('Client disconnected')
-            except:
-                print("%s: disconnected" % address[0])
-                client.close()
-                return False
+# Every picture goes out as a frame: 4-byte big-endian length + png,
+# the answer is one line with the letter
+async def game(session):
+    count = 0
+    while True:
+        let, img = random.choice(images)
+        await session.send_framed(img)
+        data = await session.ask()
+        if data != let:
+            await session.send_line('FAIL. TRY AGAIN')
+            return
+        count += 1
+        if count == QUESTIONS:
+            await session.send_line(FLAG)
+            print("%s: solved" % session.ip)
+            return
 
 if __name__ == "__main__":
     port_num = 9003
-    ThreadedServer('',port_num).listen()
+    TaskServer(game, port=port_num, timeout=TIMEOUT).run()